@@ -9,7 +9,7 @@ __version__ = "0.1.0"
 __author__ = "Michael Haas"
 
 # Import all public functions from submodules
-from .io import read_ears_file, print_file_info
+from .io import read_ears_file, read_ears_file_mmap, print_file_info
 from .signal import wavelet_denoise, threshold, thresh_wave_coeffs, detect_whistles
 from .plotting import (
     plot_waveform,
@@ -24,6 +24,9 @@ from .batch import (
     BatchProcessor,
     ResultCollector,
     timer,
+    load_processed_file,
+    denoise_cached,
+    load_checkpoint,
 )
 from .experiments import (
     BasicMetricsPipeline,
@@ -44,6 +47,7 @@ from .branching import (
 __all__ = [
     # I/O functions
     "read_ears_file",
+    "read_ears_file_mmap",
     "print_file_info",
     # Signal processing
     "wavelet_denoise",
@@ -62,6 +66,9 @@ __all__ = [
     "BatchProcessor",
     "ResultCollector",
     "timer",
+    "load_processed_file",
+    "denoise_cached",
+    "load_checkpoint",
     # Experiments
     "BasicMetricsPipeline",
     "WhistleDetectionPipeline",
@@ -6,23 +6,35 @@ This module provides tools for:
 - Running pipelines on multiple files
 - Collecting and summarizing results
 - Performance timing and monitoring
+- Caching denoised signals and whistle detections between runs
 """
 
+import os
 import time
+import json
+import pickle
+import hashlib
 import numpy as np
 from pathlib import Path
 from typing import List, Dict, Callable, Any, Optional
 import warnings
 
-
 __all__ = [
     "find_data_files",
     "select_random_files",
     "BatchProcessor",
     "timer",
     "ResultCollector",
+    "load_processed_file",
+    "denoise_cached",
+    "load_checkpoint",
 ]
 
+# Part of every denoise_cached/load_processed_file cache key; bump it
+# whenever wavelet_denoise or detect_whistles change their output so stale
+# entries are no longer returned
+CACHE_VERSION = 1
+
 
 def find_data_files(data_dir: str = "data", pattern: str = "**/*.210") -> List[Path]:
     """
@@ -184,12 +196,14 @@ class ResultCollector:
         if self.timings:
             summary["timings"] = {}
             for op, times in self.timings.items():
+                times = np.asarray(times, dtype=np.float64)
+                total = times.sum()
                 summary["timings"][op] = {
-                    "mean": np.mean(times),
-                    "std": np.std(times),
-                    "min": np.min(times),
-                    "max": np.max(times),
-                    "total": np.sum(times),
+                    "mean": total / len(times),
+                    "std": times.std(),
+                    "min": times.min(),
+                    "max": times.max(),
+                    "total": total,
                 }
 
         # Add metric statistics if results have numeric values
@@ -204,14 +218,18 @@ class ResultCollector:
 
             summary["metrics"] = {}
             for key in numeric_keys:
-                values = [r[key] for r in self.results if key in r]
-                if values:
+                values = np.fromiter(
+                    (r[key] for r in self.results if key in r), dtype=np.float64
+                )
+                if len(values):
+                    # One partition yields min, median and max together
+                    lo, median, hi = np.quantile(values, [0.0, 0.5, 1.0])
                     summary["metrics"][key] = {
-                        "mean": np.mean(values),
-                        "std": np.std(values),
-                        "min": np.min(values),
-                        "max": np.max(values),
-                        "median": np.median(values),
+                        "mean": values.mean(),
+                        "std": values.std(),
+                        "min": lo,
+                        "max": hi,
+                        "median": median,
                     }
 
         return summary
@@ -366,3 +384,198 @@ class BatchProcessor:
         print(f"Completed in {total_timer.elapsed:.2f}s\n")
 
         return self.collector
+
+
+def _cache_path(filepath: Path, cache_dir, params) -> Path:
+    """Cache entry path for filepath's current size and mtime plus params."""
+    stat = filepath.stat()
+    key = json.dumps(
+        [
+            CACHE_VERSION,
+            str(filepath.resolve()),
+            stat.st_size,
+            stat.st_mtime_ns,
+            params,
+        ],
+        default=str,
+    )
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return Path(cache_dir) / f"{filepath.name}.{digest[:16]}.pkl"
+
+
+def _cache_load(cache_path: Path):
+    """Return the pickled entry at cache_path, or None if there is none."""
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def _cache_store(cache_path: Path, value) -> None:
+    """Pickle value to cache_path."""
+    # Write to a temp file and rename so an interrupted run never
+    # leaves a truncated entry behind
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+
+def denoise_cached(
+    filepath,
+    data: np.ndarray,
+    wavelet: str = "db20",
+    hard_threshold: bool = False,
+    cache_dir: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Wavelet-denoise a recording, optionally reusing an on-disk cache.
+
+    Uses the same opt-in cache as load_processed_file (keyed on the file's
+    path, size and mtime, the parameters and CACHE_VERSION), for callers
+    that only need the denoised signal.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Source EARS file (used for the cache key)
+    data : ndarray
+        Raw acoustic data read from filepath
+    wavelet : str
+        Wavelet passed to wavelet_denoise (default: 'db20')
+    hard_threshold : bool
+        Passed to wavelet_denoise (default: False)
+    cache_dir : str, optional
+        Directory holding cache entries. If None (default), caching is
+        disabled.
+
+    Returns
+    -------
+    ndarray
+        Denoised signal
+    """
+    from .signal import wavelet_denoise
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _cache_path(
+            Path(filepath), cache_dir, ["denoise", wavelet, hard_threshold]
+        )
+        signal_clean = _cache_load(cache_path)
+        if signal_clean is not None:
+            return signal_clean
+
+    signal_clean = wavelet_denoise(data, wavelet=wavelet, hard_threshold=hard_threshold)
+    if cache_path is not None:
+        _cache_store(cache_path, signal_clean)
+    return signal_clean
+
+
+def load_processed_file(
+    filepath,
+    wavelet: str = "db20",
+    cache_dir: Optional[str] = None,
+    **detect_kwargs,
+):
+    """
+    Read an EARS file, denoise it and detect whistles, optionally caching.
+
+    Denoising and whistle detection dominate per-file CPU time, so with a
+    cache_dir repeated passes over the same files (e.g. while tuning scoring
+    weights) reuse a pickled (signal_clean, whistles) pair instead of
+    recomputing it. Each entry holds a full float64 signal (tens of MB per
+    file) and nothing is evicted, so caching is opt-in. The cache key covers
+    the file's path, size and mtime, every processing parameter and
+    CACHE_VERSION; it does not cover the processing code itself, so clear
+    the directory (or bump CACHE_VERSION) after changing the algorithms.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the EARS file
+    wavelet : str
+        Wavelet passed to wavelet_denoise (default: 'db20')
+    cache_dir : str, optional
+        Directory holding cache entries. If None (default), caching is
+        disabled.
+    **detect_kwargs
+        Extra keyword arguments passed to detect_whistles
+
+    Returns
+    -------
+    tuple
+        (data, signal_clean, whistles) where data is the read_ears_file dict
+
+    Examples
+    --------
+    >>> data, clean, whistles = load_processed_file(
+    ...     path, wavelet="db8", cache_dir=".dolphain_cache",
+    ...     power_threshold_percentile=85.0,
+    ... )
+    """
+    from .io import read_ears_file_mmap
+    from .signal import wavelet_denoise, detect_whistles
+
+    filepath = Path(filepath)
+    data = read_ears_file_mmap(filepath)
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _cache_path(
+            filepath,
+            cache_dir,
+            ["processed", wavelet, sorted(detect_kwargs.items())],
+        )
+        entry = _cache_load(cache_path)
+        if entry is not None:
+            signal_clean, whistles = entry
+            return data, signal_clean, whistles
+
+    signal_clean = wavelet_denoise(data["data"], wavelet=wavelet)
+    whistles = detect_whistles(signal_clean, data["fs"], **detect_kwargs)
+
+    if cache_path is not None:
+        _cache_store(cache_path, (signal_clean, whistles))
+
+    return data, signal_clean, whistles
+
+
+def load_checkpoint(checkpoint_file) -> tuple:
+    """
+    Replay quick_find's append-only checkpoint log (checkpoint.jsonl).
+
+    Each line holds one {"type": "result"|"error", "data": {...}} record.
+    Blank lines and a truncated last line (a write still in progress or
+    cut short by a crash) are skipped. A file recorded more than once
+    (re-run after a crash between the checkpoint and done-list writes)
+    keeps its last record.
+
+    Parameters
+    ----------
+    checkpoint_file : str or Path
+        Path to checkpoint.jsonl
+
+    Returns
+    -------
+    tuple
+        (results, errors), lists of the records' data dicts in order of
+        each file's first appearance
+
+    Raises
+    ------
+    FileNotFoundError
+        If checkpoint_file does not exist
+    """
+    records = {}
+    with open(checkpoint_file, "r") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            records[record["data"]["file"]] = record
+    results = [r["data"] for r in records.values() if r["type"] == "result"]
+    errors = [r["data"] for r in records.values() if r["type"] == "error"]
+    return results, errors
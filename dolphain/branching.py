@@ -8,9 +8,12 @@ storytelling experiences.
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from statistics import mean
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 Number = Optional[float]
 
@@ -111,29 +114,61 @@ COVERAGE_BUCKETS: List[BranchBucket] = [
 ]
 
 
-def _first_matching_bucket(value: Number, buckets: Iterable[BranchBucket]) -> BranchBucket:
-    for bucket in buckets:
-        if bucket.matches(value):
-            return bucket
+# Buckets sorted by lower edge, plus those edges, so a value's bucket is a
+# binary search (or one np.searchsorted for many values) instead of a scan
+_Ladder = Tuple[List[BranchBucket], List[float], np.ndarray]
+
+
+def _bucket_ladder(buckets: Iterable[BranchBucket]) -> _Ladder:
+    ordered = sorted(buckets, key=lambda b: b.min_value)
+    edges = [b.min_value for b in ordered]
+    return ordered, edges, np.array([b.max_value for b in ordered])
+
+
+_ENERGY_LADDER = _bucket_ladder(ENERGY_BUCKETS)
+_FREQ_LADDER = _bucket_ladder(FREQ_BUCKETS)
+_COVERAGE_LADDER = _bucket_ladder(COVERAGE_BUCKETS)
+
+
+def _first_matching_bucket(value: Number, ladder: _Ladder) -> BranchBucket:
+    ordered, edges, _ = ladder
+    if value is not None:
+        idx = bisect_right(edges, value) - 1
+        if idx >= 0 and ordered[idx].matches(value):
+            return ordered[idx]
     raise ValueError(f"Unable to categorize value {value} into provided buckets")
 
 
+def _categorize_many(values: Sequence[Number], ladder: _Ladder) -> List[BranchBucket]:
+    """Bucket every value at once; same rules as _first_matching_bucket."""
+
+    ordered, edges, max_values = ladder
+    arr = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    idx = np.searchsorted(edges, arr, side="right") - 1
+    # NaN (missing) values fail the upper-edge comparison, as do gaps
+    ok = (idx >= 0) & (arr < max_values[np.maximum(idx, 0)])
+    if not ok.all():
+        bad = values[int(np.argmin(ok))]
+        raise ValueError(f"Unable to categorize value {bad} into provided buckets")
+    return [ordered[i] for i in idx.tolist()]
+
+
 def categorize_energy(whistles_per_minute: Number) -> BranchBucket:
     """Return the energy bucket for a whistles-per-minute score."""
 
-    return _first_matching_bucket(whistles_per_minute, ENERGY_BUCKETS)
+    return _first_matching_bucket(whistles_per_minute, _ENERGY_LADDER)
 
 
 def categorize_frequency_span(freq_range_khz: Number) -> BranchBucket:
     """Return the frequency-range bucket for a clip."""
 
-    return _first_matching_bucket(freq_range_khz, FREQ_BUCKETS)
+    return _first_matching_bucket(freq_range_khz, _FREQ_LADDER)
 
 
 def categorize_coverage(coverage_percent: Number) -> BranchBucket:
     """Return the coverage bucket for a clip."""
 
-    return _first_matching_bucket(coverage_percent, COVERAGE_BUCKETS)
+    return _first_matching_bucket(coverage_percent, _COVERAGE_LADDER)
 
 
 def _safe_mean(values: Iterable[Number]) -> Number:
@@ -206,12 +241,21 @@ def build_branch_tree(records: List[Dict[str, Any]]) -> Dict[str, Any]:
 
     root_children: Dict[str, Dict[str, Dict[str, List[Dict[str, Any]]]]] = {}
 
-    for record in records:
-        stats = record.get("stats", {})
-        energy_bucket = categorize_energy(stats.get("whistles_per_minute"))
-        freq_bucket = categorize_frequency_span(stats.get("freq_range_khz"))
-        coverage_bucket = categorize_coverage(stats.get("coverage"))
+    # Classify every record per metric in one vectorized pass
+    all_stats = [record.get("stats", {}) for record in records]
+    energy_buckets = _categorize_many(
+        [s.get("whistles_per_minute") for s in all_stats], _ENERGY_LADDER
+    )
+    freq_buckets = _categorize_many(
+        [s.get("freq_range_khz") for s in all_stats], _FREQ_LADDER
+    )
+    coverage_buckets = _categorize_many(
+        [s.get("coverage") for s in all_stats], _COVERAGE_LADDER
+    )
 
+    for record, energy_bucket, freq_bucket, coverage_bucket in zip(
+        records, energy_buckets, freq_buckets, coverage_buckets
+    ):
         leaf = _build_leaf(record)
 
         energy_dict = root_children.setdefault(energy_bucket.name, {})
@@ -9,7 +9,10 @@ import datetime
 from pathlib import Path
 import numpy as np
 
-__all__ = ["read_ears_file", "print_file_info"]
+__all__ = ["read_ears_file", "read_ears_file_mmap", "print_file_info"]
+
+# One EARS record: 12-byte header followed by 250 big-endian int16 samples
+_RECORD_DTYPE = np.dtype([("header", "u1", (12,)), ("samples", ">i2", (250,))])
 
 
 def read_ears_file(filepath, normalize=False):
@@ -115,6 +118,90 @@ def read_ears_file(filepath, normalize=False):
     }
 
 
+def read_ears_file_mmap(filepath, normalize=False):
+    """
+    Read an EARS binary data file through a memory map.
+
+    Returns the same dictionary as read_ears_file(), but the records are
+    memory-mapped and decoded with a structured dtype in one vectorized
+    pass instead of unpacking them one at a time. This avoids holding the
+    raw file bytes and an intermediate Python list alongside the result.
+
+    Each 512-byte record interleaves a header with its samples, so the
+    returned 'data' is still a fresh float64 array rather than a view.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the EARS data file (.130, .190, etc.)
+    normalize : bool, optional
+        If True, normalize data to [-1, 1] range
+
+    Returns
+    -------
+    dict
+        Same keys as read_ears_file()
+
+    Examples
+    --------
+    >>> ears_data = read_ears_file_mmap('sample_data/71621DC7.190')
+    >>> print(f"Duration: {ears_data['duration']:.2f} seconds")
+    """
+    FS = 192000  # Sampling rate in Hz
+    FS_TIME = 32000  # Timestamp sampling rate
+
+    # Determine epoch based on filename
+    filename = Path(filepath).name
+    if filename[0] == "7":
+        epoch = datetime.datetime(2015, 10, 27)
+    else:
+        epoch = datetime.datetime(2000, 1, 1)
+
+    n_records = Path(filepath).stat().st_size // _RECORD_DTYPE.itemsize
+    records = np.memmap(filepath, dtype=_RECORD_DTYPE, mode="r", shape=(n_records,))
+
+    data = records["samples"].astype(np.float64).reshape(-1)
+
+    # Parse timestamps only where the header changes from the previous record
+    headers = np.array(records["header"])
+    del records
+    changed = np.ones(n_records, dtype=bool)
+    changed[1:] = (headers[1:] != headers[:-1]).any(axis=1)
+    s = headers[changed, 6:].astype(np.float64)
+    timestamp_seconds = (
+        ((s[:, 0] - 14) / 16) * 2**40
+        + s[:, 1] * 2**32
+        + s[:, 2] * 2**24
+        + s[:, 3] * 2**16
+        + s[:, 4] * 2**8
+        + s[:, 5]
+    ) / FS_TIME
+    timestamps = [
+        epoch + datetime.timedelta(seconds=seconds)
+        for seconds in timestamp_seconds.tolist()
+    ]
+
+    # Normalize if requested
+    if normalize:
+        data -= np.mean(data)
+        data /= np.max(np.abs(data))
+
+    # Calculate timing information
+    time_start = timestamps[0]
+    duration = len(data) / FS
+    time_end = time_start + datetime.timedelta(seconds=duration)
+
+    return {
+        "data": data,
+        "fs": FS,
+        "time_start": time_start,
+        "time_end": time_end,
+        "timestamps": timestamps,
+        "duration": duration,
+        "n_samples": len(data),
+    }
+
+
 def print_file_info(ears_data, filepath=None):
     """
     Print formatted information about an EARS data file.
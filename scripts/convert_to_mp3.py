@@ -4,7 +4,9 @@ Convert WAV files to MP3 for web delivery.
 Reduces file sizes by ~10x for faster loading.
 """
 
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 import argparse
@@ -44,6 +46,12 @@ def main():
         "--showcase-dir", default="site/showcase", help="Showcase directory"
     )
     parser.add_argument("--bitrate", default="128k", help="MP3 bitrate (default: 128k)")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Parallel ffmpeg processes (default: number of CPUs)",
+    )
 
     args = parser.parse_args()
 
@@ -62,21 +70,29 @@ def main():
         return
 
     print(f"🎵 Found {len(wav_files)} WAV files")
-    print(f"🔄 Converting to MP3 at {args.bitrate}...\n")
+    print(f"🔄 Converting to MP3 at {args.bitrate} ({args.jobs} jobs)...\n")
 
     converted = 0
     total_wav_size = 0
     total_mp3_size = 0
 
-    for wav_file in wav_files:
+    # ffmpeg does the work in its own process, so threads are enough to
+    # keep several encodes running at once
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        outcomes = executor.map(
+            lambda wav: convert_to_mp3(wav, wav.with_suffix(".mp3"), args.bitrate),
+            wav_files,
+        )
+
+    for wav_file, ok in zip(wav_files, outcomes):
         mp3_file = wav_file.with_suffix(".mp3")
 
         wav_size = wav_file.stat().st_size
         total_wav_size += wav_size
 
-        print(f"Converting: {wav_file.name}... ", end="", flush=True)
+        print(f"{wav_file.name}... ", end="")
 
-        if convert_to_mp3(wav_file, mp3_file, args.bitrate):
+        if ok:
             mp3_size = mp3_file.stat().st_size
             total_mp3_size += mp3_size
 
@@ -10,7 +10,7 @@ This script:
 
 Usage:
     python export_top_files.py
-    python export_top_files.py --checkpoint outputs/results/large_run/checkpoint.json --top 5
+    python export_top_files.py --checkpoint outputs/results/large_run/checkpoint.jsonl --top 5
     python export_top_files.py --checkpoint outputs/results/large_run/results.json --top 10
 """
 
@@ -32,10 +32,14 @@ def load_results(checkpoint_path):
         print(f"❌ File not found: {checkpoint_path}")
         return None
 
+    if checkpoint_path.suffix == ".jsonl":
+        # quick_find's append-only checkpoint: one record per line
+        results, errors = dolphain.load_checkpoint(checkpoint_path)
+        return {"results": results, "errors": errors}
+
     try:
         with open(checkpoint_path, "r") as f:
-            data = json.load(f)
-        return data
+            return json.load(f)
     except json.JSONDecodeError:
         print(f"❌ Invalid JSON in: {checkpoint_path}")
         return None
@@ -356,13 +360,13 @@ def main():
         epilog="""
 Examples:
   # Export top 5 from running checkpoint
-  python export_top_files.py --checkpoint outputs/results/large_run/checkpoint.json
+  python export_top_files.py --checkpoint outputs/results/large_run/checkpoint.jsonl
   
   # Export top 5 from completed results
   python export_top_files.py --checkpoint outputs/results/large_run/results.json
   
   # Export top 10 files
-  python export_top_files.py --checkpoint quick_find_results/checkpoint.json --top 10
+  python export_top_files.py --checkpoint quick_find_results/checkpoint.jsonl --top 10
   
   # Custom output directory
   python export_top_files.py --checkpoint results.json --output-dir my_exports/
@@ -370,7 +374,7 @@ Examples:
     )
 
     parser.add_argument(
-        "--checkpoint", type=Path, help="Path to checkpoint.json or results.json file"
+        "--checkpoint", type=Path, help="Path to checkpoint.jsonl or results.json file"
     )
     parser.add_argument(
         "--top", type=int, default=5, help="Number of top files to export (default: 5)"
@@ -387,9 +391,9 @@ Examples:
     if not args.checkpoint:
         # Try common locations
         candidates = [
-            Path("quick_find_results/checkpoint.json"),
+            Path("quick_find_results/checkpoint.jsonl"),
             Path("quick_find_results/results.json"),
-            Path("outputs/results/large_run/checkpoint.json"),
+            Path("outputs/results/large_run/checkpoint.jsonl"),
             Path("outputs/results/large_run/results.json"),
         ]
 
@@ -402,7 +406,9 @@ Examples:
         if not args.checkpoint:
             print("❌ No checkpoint file specified and none found in common locations")
             print("\nTry:")
-            print("  python export_top_files.py --checkpoint <path-to-checkpoint.json>")
+            print(
+                "  python export_top_files.py --checkpoint <path-to-checkpoint.jsonl>"
+            )
             print("\nCommon locations:")
             for c in candidates:
                 print(f"  - {c}")
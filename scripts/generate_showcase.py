@@ -26,6 +26,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dolphain.io import read_ears_file
 from dolphain.signal import wavelet_denoise, detect_whistles
+from dolphain.batch import load_checkpoint
 
 
 def create_spectrogram_image(audio_data, sample_rate, output_path, title=""):
@@ -385,8 +386,12 @@ def main():
 
     # Load results
     print(f"📂 Loading results from {args.checkpoint}")
-    with open(args.checkpoint, "r") as f:
-        results = json.load(f)
+    if args.checkpoint.endswith(".jsonl"):
+        # quick_find's append-only checkpoint: one record per line
+        results = {"results": load_checkpoint(args.checkpoint)[0]}
+    else:
+        with open(args.checkpoint, "r") as f:
+            results = json.load(f)
 
     # Get top files (handle both formats)
     results_list = None
@@ -10,25 +10,24 @@ Usage:
 
 import sys
 import argparse
-import json
 import time
 from pathlib import Path
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import dolphain
 
-def load_checkpoint(checkpoint_file):
-    """Load current checkpoint data."""
-    if not checkpoint_file.exists():
-        return None
 
+def load_checkpoint(checkpoint_file):
+    """Load current checkpoint data from quick_find's append-only JSONL log."""
     try:
-        with open(checkpoint_file, "r") as f:
-            data = json.load(f)
-        return data
-    except (json.JSONDecodeError, FileNotFoundError):
+        results, errors = dolphain.load_checkpoint(checkpoint_file)
+        last_updated = checkpoint_file.stat().st_mtime
+    except FileNotFoundError:
         return None
+    return {"results": results, "errors": errors, "last_updated": last_updated}
 
 
 def plot_top_5(checkpoint_file, ax1, ax2, ax3):
@@ -187,7 +186,7 @@ def plot_top_5(checkpoint_file, ax1, ax2, ax3):
 
 def monitor_live(output_dir, refresh_interval=5):
     """Monitor with live updating plot."""
-    checkpoint_file = output_dir / "checkpoint.json"
+    checkpoint_file = output_dir / "checkpoint.jsonl"
 
     print("=" * 80)
     print("🐬 QUICK FIND LIVE MONITOR")
@@ -226,7 +225,7 @@ def monitor_live(output_dir, refresh_interval=5):
 
 def monitor_once(output_dir):
     """Single snapshot of current status."""
-    checkpoint_file = output_dir / "checkpoint.json"
+    checkpoint_file = output_dir / "checkpoint.jsonl"
 
     print("=" * 80)
     print("🐬 QUICK FIND SNAPSHOT")
@@ -10,11 +10,13 @@ Usage:
 
 import sys
 import argparse
-import json
 import time
 from pathlib import Path
 import os
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import dolphain
+
 
 def clear_screen():
     """Clear terminal screen."""
@@ -22,16 +24,13 @@ def clear_screen():
 
 
 def load_checkpoint(checkpoint_file):
-    """Load current checkpoint data."""
-    if not checkpoint_file.exists():
-        return None
-
+    """Load current checkpoint data from quick_find's append-only JSONL log."""
     try:
-        with open(checkpoint_file, "r") as f:
-            data = json.load(f)
-        return data
-    except (json.JSONDecodeError, FileNotFoundError):
+        results, errors = dolphain.load_checkpoint(checkpoint_file)
+        last_updated = checkpoint_file.stat().st_mtime
+    except FileNotFoundError:
         return None
+    return {"results": results, "errors": errors, "last_updated": last_updated}
 
 
 def print_status(checkpoint_file):
@@ -119,7 +118,7 @@ def print_status(checkpoint_file):
 
 def monitor_live(output_dir, refresh_interval=5):
     """Monitor with live updating in terminal."""
-    checkpoint_file = output_dir / "checkpoint.json"
+    checkpoint_file = output_dir / "checkpoint.jsonl"
 
     try:
         while True:
@@ -18,17 +18,104 @@ Usage:
 """
 
 import sys
+import os
+import json
 import argparse
+import heapq
 from pathlib import Path
 import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import numpy as np
 from scipy import signal as sp_signal
+from scipy.fft import next_fast_len
 from scipy.ndimage import maximum_filter
-from scipy.stats import entropy
 
 sys.path.insert(0, str(Path(__file__).parent))
 import dolphain
 
+# Fixed CSV schemas (column order matches the result dicts built in analyze_file)
+STANDARD_RESULT_COLS = [
+    "file",
+    "filename",
+    "recording_duration",
+    "n_chirps",
+    "chirp_coverage_percent",
+    "mean_chirp_duration",
+    "mean_freq_sweep",
+    "n_click_trains",
+    "total_clicks",
+    "click_train_coverage_percent",
+    "mean_click_train_duration",
+    "mean_click_rate",
+    "mean_ici",
+    "interestingness_score",
+]
+UNIQUE_RESULT_COLS = [
+    "file",
+    "filename",
+    "recording_duration",
+    "interestingness_score",
+    "uniqueness_score",
+    "active_bands",
+    "spectral_entropy",
+    "freq_range",
+    "max_freq",
+    "max_simultaneous",
+    "fast_sweeps",
+    "harmonics",
+    "burst_clicks",
+    "n_chirps",
+    "n_click_trains",
+    "total_clicks",
+]
+
+
+def hilbert_envelope(x):
+    """
+    Amplitude envelope of the analytic signal.
+
+    The FFT is zero-padded to a fast length: EARS files hold a multiple of
+    250 samples, and record counts with large prime factors otherwise hit a
+    several-times slower FFT path.
+
+    Padding changes the envelope near the record edges: on band-passed
+    noise it differs from the unpadded transform by up to tens of percent
+    of its mean within the first and last few hundred samples (about
+    1-2 ms at EARS rates), while the interior agrees to well under 1%.
+    Click peaks at the very start or end of a record, and the percentile
+    thresholds derived from the envelope, may therefore shift slightly
+    compared with an unpadded Hilbert transform.
+
+    Parameters
+    ----------
+    x : array_like
+        Real 1D signal
+
+    Returns
+    -------
+    envelope : ndarray
+        Same shape as x
+    """
+    x = np.asarray(x)
+    n = len(x)
+    analytic = sp_signal.hilbert(x, N=next_fast_len(n, real=True))
+    return np.abs(analytic[:n])
+
+
+def mean_std(x):
+    """
+    Mean and (population) standard deviation from one pass of sums.
+
+    Equivalent to ``(np.mean(x), np.std(x))`` for the short difference
+    arrays used by the detectors, without the separate reductions.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = x.size
+    mean = x.sum() / n
+    var = max(np.dot(x, x) / n - mean * mean, 0.0)
+    return mean, np.sqrt(var)
+
 
 def detect_chirps(data, fs, min_duration=0.3, freq_sweep_min=3000):
     """
@@ -68,15 +155,16 @@ def detect_chirps(data, fs, min_duration=0.3, freq_sweep_min=3000):
         window="hann",
         scaling="density",
     )
+    # Single precision is plenty for dB thresholds and halves memory traffic
+    Sxx = Sxx.astype(np.float32, copy=False)
 
     # Convert to dB
-    Sxx_dB = 10 * np.log10(Sxx + 1e-12)
+    Sxx_dB = 10 * np.log10(Sxx + np.float32(1e-12))
 
     # Very high threshold - only the strongest signals (95th percentile)
-    power_threshold = np.percentile(Sxx_dB, 95)
-
     # Additional absolute threshold - must be significantly above noise floor
-    noise_floor = np.percentile(Sxx_dB, 10)
+    # (both percentiles come from a single partition pass)
+    power_threshold, noise_floor = np.percentile(Sxx_dB, [95, 10])
     min_snr_db = 15  # Must be 15 dB above noise floor
     absolute_threshold = noise_floor + min_snr_db
     power_threshold = max(power_threshold, absolute_threshold)
@@ -156,8 +244,7 @@ def detect_chirps(data, fs, min_duration=0.3, freq_sweep_min=3000):
         # Additional quality check: sweep must be relatively continuous
         # Check that it's actually sweeping, not jumping around
         freq_changes = np.abs(np.diff(freq_indices))
-        mean_change = np.mean(freq_changes)
-        std_change = np.std(freq_changes)
+        mean_change, std_change = mean_std(freq_changes)
 
         # Reject if too erratic (jumping around vs smooth sweep)
         if std_change > 3 * mean_change:
@@ -166,20 +253,23 @@ def detect_chirps(data, fs, min_duration=0.3, freq_sweep_min=3000):
         times = t[time_indices]
         freqs = f[freq_indices]
 
-        duration = times[-1] - times[0]
-        freq_sweep = abs(freqs[-1] - freqs[0])
+        # Native floats: keeps downstream per-file sums off NumPy scalars
+        start_time, end_time = times[[0, -1]].tolist()
+        start_freq, end_freq = freqs[[0, -1]].tolist()
+        duration = end_time - start_time
+        freq_sweep = abs(end_freq - start_freq)
 
         result_chirps.append(
             {
-                "start_time": times[0],
-                "end_time": times[-1],
+                "start_time": start_time,
+                "end_time": end_time,
                 "duration": duration,
-                "start_freq": freqs[0],
-                "end_freq": freqs[-1],
+                "start_freq": start_freq,
+                "end_freq": end_freq,
                 "freq_sweep": freq_sweep,
                 "sweep_rate": freq_sweep / duration if duration > 0 else 0,
-                "min_freq": freqs.min(),
-                "max_freq": freqs.max(),
+                "min_freq": float(freqs.min()),
+                "max_freq": float(freqs.max()),
                 "n_points": len(times),
             }
         )
@@ -227,11 +317,13 @@ def detect_click_trains(
 
     # Higher order filter for sharper cutoff
     sos = sp_signal.butter(6, [low, high], btype="bandpass", output="sos")
+    # Zero-phase (forward-backward) filtering: a single sosfilt pass would
+    # distort each click differently (Butterworth group delay is not
+    # constant) and halve the stopband attenuation in dB
     filtered = sp_signal.sosfiltfilt(sos, data)
 
     # Compute envelope using Hilbert transform
-    analytic = sp_signal.hilbert(filtered)
-    envelope = np.abs(analytic)
+    envelope = hilbert_envelope(filtered)
 
     # Minimal smoothing to preserve sharp click edges
     kernel_size = int(fs * 0.0005)  # 0.5ms - keep clicks sharp
@@ -241,10 +333,9 @@ def detect_click_trains(
         envelope = sp_signal.medfilt(envelope, kernel_size=kernel_size)
 
     # VERY HIGH threshold - only the strongest clicks (99.5th percentile!)
-    threshold_percentile = np.percentile(envelope, 99.5)
-
     # Also require absolute threshold well above noise
-    noise_level = np.percentile(envelope, 20)
+    # (both percentiles come from a single partition pass)
+    threshold_percentile, noise_level = np.percentile(envelope, [99.5, 20])
     min_click_amplitude = (
         noise_level * 10
     )  # Must be 10x noise level (increased from 8x)
@@ -288,80 +379,52 @@ def detect_click_trains(
     peak_indices = np.array(sharp_peaks)
     peak_times = peak_indices / fs
 
-    # Group peaks into click trains based on ICI
-    click_trains = []
-    current_train = [peak_times[0]]
-
-    for i in range(1, len(peak_times)):
-        ici = peak_times[i] - peak_times[i - 1]
+    # Group peaks into click trains based on ICI: label each peak with its
+    # train (a new train starts wherever the gap to the previous peak exceeds
+    # max_ici) and compute every train's ICI statistics at once
+    icis_all = np.diff(peak_times)
+    in_train = icis_all <= max_ici
+    train_starts = np.flatnonzero(np.concatenate(([True], ~in_train)))
+    n_trains = len(train_starts)
+    train_clicks = np.diff(np.append(train_starts, len(peak_times)))
+
+    ici_labels = np.cumsum(~in_train)[in_train]
+    train_icis = icis_all[in_train]
+    n_icis = np.maximum(train_clicks - 1, 1)
+    mean_icis = np.bincount(ici_labels, weights=train_icis, minlength=n_trains) / n_icis
+    mean_sq_icis = (
+        np.bincount(ici_labels, weights=train_icis**2, minlength=n_trains) / n_icis
+    )
+    std_icis = np.sqrt(np.maximum(mean_sq_icis - mean_icis**2, 0.0))
 
-        if ici <= max_ici:
-            # Continue current train
-            current_train.append(peak_times[i])
-        else:
-            # Save current train if long enough AND regular enough
-            if len(current_train) >= min_clicks:
-                train_data = np.array(current_train)
-                icis = np.diff(train_data)
-
-                # NEW: Check for regularity - real spike trains have consistent spacing
-                mean_ici = np.mean(icis)
-                std_ici = np.std(icis)
-
-                # Coefficient of variation - require relatively consistent ICIs
-                # CV < 0.5 means ICI std is less than 50% of mean (reasonably regular)
-                if mean_ici > 0:
-                    cv = std_ici / mean_ici
-                    if cv < 0.5:  # Only accept regular trains
-                        click_trains.append(
-                            {
-                                "start_time": train_data[0],
-                                "end_time": train_data[-1],
-                                "duration": train_data[-1] - train_data[0],
-                                "n_clicks": len(train_data),
-                                "mean_ici": mean_ici,
-                                "std_ici": std_ici,
-                                "regularity_cv": cv,  # Track regularity metric
-                                "click_rate": (
-                                    len(train_data) / (train_data[-1] - train_data[0])
-                                    if train_data[-1] > train_data[0]
-                                    else 0
-                                ),
-                                "click_times": train_data.tolist(),
-                            }
-                        )
+    # Keep trains that are long enough AND regular enough. Coefficient of
+    # variation - real spike trains have consistent spacing; CV < 0.5 means
+    # ICI std is less than 50% of mean (reasonably regular)
+    cvs = np.divide(
+        std_icis, mean_icis, out=np.full(n_trains, np.inf), where=mean_icis > 0
+    )
+    accepted = (train_clicks >= min_clicks) & (cvs < 0.5)
 
-            # Start new train
-            current_train = [peak_times[i]]
-
-    # Don't forget the last train (with same regularity check)
-    if len(current_train) >= min_clicks:
-        train_data = np.array(current_train)
-        icis = np.diff(train_data)
-
-        mean_ici = np.mean(icis)
-        std_ici = np.std(icis)
-
-        if mean_ici > 0:
-            cv = std_ici / mean_ici
-            if cv < 0.5:  # Only accept regular trains
-                click_trains.append(
-                    {
-                        "start_time": train_data[0],
-                        "end_time": train_data[-1],
-                        "duration": train_data[-1] - train_data[0],
-                        "n_clicks": len(train_data),
-                        "mean_ici": mean_ici,
-                        "std_ici": std_ici,
-                        "regularity_cv": cv,
-                        "click_rate": (
-                            len(train_data) / (train_data[-1] - train_data[0])
-                            if train_data[-1] > train_data[0]
-                            else 0
-                        ),
-                        "click_times": train_data.tolist(),
-                    }
-                )
+    # Native floats: keeps downstream per-file sums off NumPy scalars
+    click_trains = []
+    for k in np.flatnonzero(accepted).tolist():
+        train_data = peak_times[
+            train_starts[k] : train_starts[k] + train_clicks[k]
+        ].tolist()
+        start, end = train_data[0], train_data[-1]
+        click_trains.append(
+            {
+                "start_time": start,
+                "end_time": end,
+                "duration": end - start,
+                "n_clicks": len(train_data),
+                "mean_ici": float(mean_icis[k]),
+                "std_ici": float(std_icis[k]),
+                "regularity_cv": float(cvs[k]),  # Track regularity metric
+                "click_rate": len(train_data) / (end - start) if end > start else 0,
+                "click_times": train_data,
+            }
+        )
 
     return click_trains
 
@@ -383,8 +446,9 @@ def detect_unique_features(data, fs):
         window="hann",
         scaling="density",
     )
+    Sxx = Sxx.astype(np.float32, copy=False)
 
-    Sxx_dB = 10 * np.log10(Sxx + 1e-12)
+    Sxx_dB = 10 * np.log10(Sxx + np.float32(1e-12))
 
     features = {}
 
@@ -411,7 +475,9 @@ def detect_unique_features(data, fs):
     # 2. Spectral entropy (frequency diversity)
     freq_power = np.sum(Sxx, axis=1)
     freq_power_norm = freq_power / np.sum(freq_power)
-    features["spectral_entropy"] = float(entropy(freq_power_norm))
+    features["spectral_entropy"] = float(
+        -np.sum(freq_power_norm * np.log(freq_power_norm + 1e-12))
+    )
 
     # 3. Peak frequency range
     threshold = np.percentile(Sxx_dB, 95)
@@ -424,19 +490,29 @@ def detect_unique_features(data, fs):
         features["max_freq"] = 0.0
 
     # 4. Simultaneous signals
-    max_simultaneous = 0
-    for time_idx in range(len(t)):
-        col = Sxx_dB[:, time_idx]
-        threshold_col = np.percentile(col, 95)
-        peaks, _ = sp_signal.find_peaks(col, height=threshold_col, distance=50)
-        max_simultaneous = max(max_simultaneous, len(peaks))
+    # Find local maxima for every frame at once, then enforce the 50-bin peak
+    # spacing with a single find_peaks call over all frames laid end to end
+    # (separated by -inf gaps so peaks in different frames never interact).
+    col_thresholds = np.quantile(Sxx_dB, 0.95, axis=0)
+    inner = Sxx_dB[1:-1, :]
+    candidates = (
+        (inner > Sxx_dB[:-2, :])
+        & (inner > Sxx_dB[2:, :])
+        & (inner >= col_thresholds[None, :])
+    )
+    stride = inner.shape[0] + 50
+    rows, cols = np.nonzero(candidates)
+    frames = np.full(stride * len(t), -np.inf)
+    frames[cols * stride + rows] = inner[rows, cols]
+    peaks, _ = sp_signal.find_peaks(frames, distance=50)
+    peaks_per_frame = np.bincount(peaks // stride, minlength=len(t))
 
-    features["max_simultaneous"] = max_simultaneous
+    features["max_simultaneous"] = int(peaks_per_frame.max(initial=0))
 
     # 5. Ultra-fast sweeps
+    # Reuses the global 95th percentile threshold from section 3
     fast_sweeps = 0
     chirps = []
-    threshold = np.percentile(Sxx_dB, 95)
 
     for time_idx in range(len(t)):
         col = Sxx_dB[:, time_idx]
@@ -477,20 +553,20 @@ def detect_unique_features(data, fs):
 
     # 6. Harmonics
     harmonics = 0
-    for time_idx in range(0, len(t), 5):
+    col90 = np.quantile(Sxx_dB[:, ::5], 0.90, axis=0)
+    for k, time_idx in enumerate(range(0, len(t), 5)):
         col = Sxx_dB[:, time_idx]
-        peaks, _ = sp_signal.find_peaks(
-            col, height=np.percentile(col, 90), distance=20, prominence=5
-        )
+        peaks, _ = sp_signal.find_peaks(col, height=col90[k], distance=20, prominence=5)
 
         if len(peaks) >= 2:
             peak_freqs = f[peaks]
-            for i in range(len(peak_freqs)):
-                for j in range(i + 1, len(peak_freqs)):
-                    ratio = peak_freqs[j] / peak_freqs[i]
-                    if 1.8 < ratio < 2.2 or 2.8 < ratio < 3.2:
-                        harmonics += 1
-                        break
+            # ratios[i, j] = f_j / f_i; count each peak with a 2x/3x partner above it
+            ratios = peak_freqs[None, :] / peak_freqs[:, None]
+            is_harmonic = np.triu(
+                ((ratios > 1.8) & (ratios < 2.2)) | ((ratios > 2.8) & (ratios < 3.2)),
+                k=1,
+            )
+            harmonics += int(np.count_nonzero(is_harmonic.any(axis=1)))
 
     features["harmonics"] = harmonics
 
@@ -498,8 +574,7 @@ def detect_unique_features(data, fs):
     nyquist = fs / 2.0
     sos = sp_signal.butter(6, [20000 / nyquist, 0.999], btype="bandpass", output="sos")
     filtered = sp_signal.sosfiltfilt(sos, data)
-    analytic = sp_signal.hilbert(filtered)
-    envelope = np.abs(analytic)
+    envelope = hilbert_envelope(filtered)
 
     threshold = np.percentile(envelope, 99)
     peaks, _ = sp_signal.find_peaks(
@@ -512,7 +587,8 @@ def detect_unique_features(data, fs):
         features["burst_clicks"] = int(np.sum(icis < 0.005))
 
         if len(icis) > 2:
-            cv = np.std(icis) / np.mean(icis) if np.mean(icis) > 0 else 999
+            mean_ici, std_ici = mean_std(icis)
+            cv = std_ici / mean_ici if mean_ici > 0 else 999
             features["click_regularity"] = (
                 cv < 0.3 or cv > 0.8
             )  # Very regular or very irregular
@@ -523,6 +599,52 @@ def detect_unique_features(data, fs):
     return features
 
 
+def detection_stats(chirps, click_trains, recording_duration):
+    """
+    Per-file chirp and click-train summary statistics.
+
+    Each detection list is walked once, accumulating every field needed,
+    rather than once per statistic with np.mean over temporary lists.
+
+    Returns dict with chirp fields (n_chirps, chirp_coverage_percent,
+    mean_chirp_duration, mean_freq_sweep) and click train fields
+    (n_click_trains, total_clicks, click_train_coverage_percent,
+    mean_click_train_duration, mean_click_rate, mean_ici).
+    """
+    n_chirps = len(chirps)
+    chirp_duration = total_sweep = 0.0
+    for c in chirps:
+        chirp_duration += c["duration"]
+        total_sweep += c["freq_sweep"]
+
+    n_click_trains = len(click_trains)
+    total_clicks = 0
+    ct_duration = total_click_rate = total_ici = 0.0
+    for ct in click_trains:
+        total_clicks += ct["n_clicks"]
+        ct_duration += ct["duration"]
+        total_click_rate += ct["click_rate"]
+        total_ici += ct["mean_ici"]
+
+    # Coverage calculations (empty lists have zero totals, so means are 0.0)
+    n_c = n_chirps or 1
+    n_ct = n_click_trains or 1
+    return {
+        # Chirp data
+        "n_chirps": n_chirps,
+        "chirp_coverage_percent": chirp_duration / recording_duration * 100,
+        "mean_chirp_duration": chirp_duration / n_c,
+        "mean_freq_sweep": total_sweep / n_c,
+        # Click train data
+        "n_click_trains": n_click_trains,
+        "total_clicks": total_clicks,
+        "click_train_coverage_percent": ct_duration / recording_duration * 100,
+        "mean_click_train_duration": ct_duration / n_ct,
+        "mean_click_rate": total_click_rate / n_ct,
+        "mean_ici": total_ici / n_ct,
+    }
+
+
 def calculate_uniqueness_score(features):
     """Calculate uniqueness score (0-100) for exceptional features."""
     score = 0.0
@@ -594,12 +716,10 @@ def calculate_interestingness_score(result, chirps, click_trains, signal_clean,
     score += min(15, (n_chirps / 20) * 15)
 
     # Chirp quality - sweep range and rate (15 points)
+    # (plain sums: these lists are a handful of entries, too short for numpy)
     if chirps and len(chirps) > 0:
-        sweep_ranges = [c["freq_sweep"] for c in chirps]
-        sweep_rates = [c["sweep_rate"] for c in chirps]
-
-        mean_sweep = np.mean(sweep_ranges)
-        mean_rate = np.mean(sweep_rates)
+        mean_sweep = sum(c["freq_sweep"] for c in chirps) / len(chirps)
+        mean_rate = sum(c["sweep_rate"] for c in chirps) / len(chirps)
 
         # Reward large frequency sweeps (up to 10 points)
         score += min(10, (mean_sweep / 5000) * 10)
@@ -609,8 +729,9 @@ def calculate_interestingness_score(result, chirps, click_trains, signal_clean,
 
     # Chirp diversity - variety in frequencies (10 points)
     if chirps and len(chirps) >= 2:
-        start_freqs = [c["start_freq"] for c in chirps]
-        freq_std = np.std(start_freqs)
+        mean_start = sum(c["start_freq"] for c in chirps) / len(chirps)
+        freq_var = sum((c["start_freq"] - mean_start) ** 2 for c in chirps)
+        freq_std = (freq_var / len(chirps)) ** 0.5
         score += min(10, (freq_std / 5000) * 10)
 
     # === CLICK TRAIN SCORING (40 points) ===
@@ -624,15 +745,13 @@ def calculate_interestingness_score(result, chirps, click_trains, signal_clean,
     # Click train regularity (10 points)
     if click_trains and len(click_trains) > 0:
         # Reward consistent ICIs (lower std = more regular)
-        ici_stds = [ct["std_ici"] for ct in click_trains]
-        mean_ici_std = np.mean(ici_stds)
+        mean_ici_std = sum(ct["std_ici"] for ct in click_trains) / len(click_trains)
         regularity = max(0, 1.0 - (mean_ici_std / 0.02))  # Normalize by 20ms
         score += regularity * 10
 
     # Click rate quality (10 points)
     if click_trains and len(click_trains) > 0:
-        click_rates = [ct["click_rate"] for ct in click_trains]
-        mean_rate = np.mean(click_rates)
+        mean_rate = sum(ct["click_rate"] for ct in click_trains) / len(click_trains)
         # Typical dolphin click rates: 20-200 clicks/sec
         if 20 <= mean_rate <= 200:
             score += 10
@@ -648,16 +767,22 @@ def calculate_interestingness_score(result, chirps, click_trains, signal_clean,
         # Downsample for faster FFT
         signal_ds = signal_clean[::10]
         fft = np.fft.rfft(signal_ds)
-        power_spectrum = np.abs(fft) ** 2
         freq_bins = np.fft.rfftfreq(len(signal_ds), 10 / fs)
 
+        # Bins are sorted, so each band is a contiguous slice of the spectrum
         # High-frequency signal band (clicks + chirps)
-        signal_mask = (freq_bins >= 5000) & (freq_bins <= 50000)
-        noise_mask = (freq_bins >= 500) & (freq_bins <= 2000)
-
-        if np.any(signal_mask) and np.any(noise_mask):
-            signal_power = np.mean(power_spectrum[signal_mask])
-            noise_power = np.mean(power_spectrum[noise_mask])
+        sig_lo = np.searchsorted(freq_bins, 5000, side="left")
+        sig_hi = np.searchsorted(freq_bins, 50000, side="right")
+        # Low-frequency noise band
+        noise_lo = np.searchsorted(freq_bins, 500, side="left")
+        noise_hi = np.searchsorted(freq_bins, 2000, side="right")
+
+        if sig_hi > sig_lo and noise_hi > noise_lo:
+            signal_band = fft[sig_lo:sig_hi]
+            noise_band = fft[noise_lo:noise_hi]
+            # vdot(z, z) = sum(|z|^2) without a temporary power array
+            signal_power = np.vdot(signal_band, signal_band).real / signal_band.size
+            noise_power = np.vdot(noise_band, noise_band).real / noise_band.size
             snr = 10 * np.log10(signal_power / (noise_power + 1e-10))
             score += min(20, max(0, (snr / 30) * 20))
     except:
@@ -666,6 +791,231 @@ def calculate_interestingness_score(result, chirps, click_trains, signal_clean,
     return score
 
 
+def band_power(data, fs, band=(5000, 150000)):
+    """
+    Cheap pre-screen statistic: mean power spectral density within a band.
+
+    Uses a short-segment Welch estimate, which costs a small fraction of the
+    wavelet denoise + spectrogram + Hilbert work done by the detectors.
+
+    Parameters
+    ----------
+    data : array_like
+        Raw acoustic data
+    fs : int
+        Sampling frequency in Hz
+    band : tuple
+        Frequency band in Hz (default: 5-150 kHz, covering chirps and clicks)
+
+    Returns
+    -------
+    power : float
+        Mean PSD within the band (0.0 if the band is above Nyquist)
+    """
+    f, psd = sp_signal.welch(np.asarray(data, dtype=np.float32), fs=fs, nperseg=1024)
+    mask = (f >= band[0]) & (f <= band[1])
+    if not np.any(mask):
+        return 0.0
+    return float(np.mean(psd[mask]))
+
+
+def warm_page_cache(file_path, chunk_size=1 << 20):
+    """
+    Read a file and discard the bytes so the OS page cache holds it.
+
+    Run on a background thread a few files ahead of the worker processes,
+    this overlaps slow (USB/NAS) reads with analysis of earlier files
+    without shipping raw signals between processes.
+
+    Args:
+        file_path: File to read
+        chunk_size: Read buffer size in bytes
+    """
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            buf = bytearray(chunk_size)
+            while f.readinto(buf):
+                pass
+    except OSError:
+        pass  # analyze_file reports unreadable files
+
+
+def analyze_file(file_path, mode="standard", min_band_power=None, cache_dir=None):
+    """
+    Run the full per-file analysis for quick_find.
+
+    Module-level so it can run in worker processes. Never raises: failures
+    are returned as an error record instead.
+
+    Args:
+        file_path: EARS file to analyze
+        mode: 'standard' for chirps/clicks, 'unique' for exceptional features
+        min_band_power: Pre-screen threshold (see quick_find)
+        cache_dir: Denoised-signal cache directory (see dolphain.denoise_cached)
+
+    Returns:
+        (result, error, prescreened) - exactly one of result/error is None
+    """
+    fp_str = str(file_path)
+    fp_name = file_path.name
+    try:
+        # Read and process file
+        data_dict = dolphain.read_ears_file(file_path)
+        rec_dur = data_dict["duration"]
+        fs = data_dict["fs"]
+
+        # Pre-screen: quiet, noise-only files skip denoising and detection
+        prescreened = (
+            mode != "unique"
+            and min_band_power is not None
+            and band_power(data_dict["data"], fs) < min_band_power
+        )
+
+        if prescreened:
+            result = {
+                "file": fp_str,
+                "filename": fp_name,
+                "recording_duration": rec_dur,
+                "n_chirps": 0,
+                "chirp_coverage_percent": 0.0,
+                "mean_chirp_duration": 0.0,
+                "mean_freq_sweep": 0.0,
+                "n_click_trains": 0,
+                "total_clicks": 0,
+                "click_train_coverage_percent": 0.0,
+                "mean_click_train_duration": 0.0,
+                "mean_click_rate": 0.0,
+                "mean_ici": 0.0,
+                "interestingness_score": 0.0,
+            }
+            return result, None, True
+
+        # More aggressive denoising to remove noise before detection
+        # (db8 with hard thresholding removes more noise)
+        signal_clean = dolphain.denoise_cached(
+            file_path,
+            data_dict["data"],
+            wavelet="db8",
+            hard_threshold=True,
+            cache_dir=cache_dir,
+        )
+
+        if mode == "unique":
+            # Unique signal detection mode
+            unique_features = detect_unique_features(signal_clean, fs)
+            uniqueness_score = calculate_uniqueness_score(unique_features)
+
+            result = {
+                "file": fp_str,
+                "filename": fp_name,
+                "recording_duration": rec_dur,
+                "interestingness_score": round(
+                    uniqueness_score, 2
+                ),  # Use interestingness_score for compatibility
+                "uniqueness_score": round(
+                    uniqueness_score, 2
+                ),  # Also keep for reference
+                "active_bands": unique_features.get("active_bands", 0),
+                "spectral_entropy": round(
+                    unique_features.get("spectral_entropy", 0), 2
+                ),
+                "freq_range": round(unique_features.get("freq_range", 0), 1),
+                "max_freq": round(unique_features.get("max_freq", 0), 1),
+                "max_simultaneous": unique_features.get("max_simultaneous", 0),
+                "fast_sweeps": unique_features.get("fast_sweeps", 0),
+                "harmonics": unique_features.get("harmonics", 0),
+                "burst_clicks": unique_features.get("burst_clicks", 0),
+                # Add placeholder fields that showcase might expect
+                "n_chirps": 0,  # Not detected in unique mode
+                "n_click_trains": 0,  # Not detected in unique mode
+                "total_clicks": 0,  # Not detected in unique mode
+            }
+        else:
+            # Standard chirp/click detection mode
+            # Detect chirps (very conservative parameters)
+            chirps = detect_chirps(
+                signal_clean,
+                fs,
+                min_duration=0.3,  # Longer minimum duration
+                freq_sweep_min=3000,  # Larger frequency sweep required
+            )
+
+            # Detect click trains (very conservative)
+            click_trains = detect_click_trains(
+                signal_clean,
+                fs,
+                click_freq_range=(
+                    20000,
+                    min(fs // 2, 150000),
+                ),  # Higher frequency minimum
+                min_clicks=15,  # More clicks required
+                max_ici=0.05,
+            )
+
+            result = {
+                "file": fp_str,
+                "filename": fp_name,
+                "recording_duration": rec_dur,
+                **detection_stats(chirps, click_trains, rec_dur),
+            }
+
+            # Calculate interestingness score
+            score = calculate_interestingness_score(
+                result, chirps, click_trains, signal_clean, fs
+            )
+            result["interestingness_score"] = round(score, 2)
+
+        return result, None, False
+
+    except Exception as e:
+        return None, {"file": fp_str, "error": str(e)}, False
+
+
+def tally_result(counts, result):
+    """
+    Fold one result into the running summary counters.
+
+    Keeping the counters up to date as results arrive lets the progress
+    lines and final summary avoid rescanning every result.
+
+    Args:
+        counts: Counter of summary totals, updated in place
+        result: Result dict from analyze_file
+    """
+    n_chirps = result.get("n_chirps", 0)
+    n_click_trains = result.get("n_click_trains", 0)
+    counts["high_score"] += result.get("interestingness_score", 0) > 70
+    counts["with_harmonics"] += result.get("harmonics", 0) > 0
+    counts["with_fast_sweeps"] += result.get("fast_sweeps", 0) > 0
+    counts["multi_band"] += result.get("active_bands", 0) >= 4
+    counts["with_chirps"] += n_chirps > 0
+    counts["with_clicks"] += n_click_trains > 0
+    counts["with_both"] += n_chirps > 0 and n_click_trains > 0
+    counts["chirps"] += n_chirps
+    counts["click_trains"] += n_click_trains
+    counts["clicks"] += result.get("total_clicks", 0)
+    counts["score_total"] += result.get("interestingness_score", 0)
+
+
+def write_results_json(path, payload):
+    """
+    Write the final results.json.
+
+    Compact output stays on json's C encoder (indent= forces the
+    pure-Python one); pretty-print with `python -m json.tool` if needed.
+    """
+    with open(path, "w") as f:
+        json.dump(payload, f)
+
+
+def write_results_csv(path, results, columns):
+    """Write all_results.csv with a fixed column list (see *_RESULT_COLS)."""
+    import pandas as pd
+
+    df = pd.DataFrame.from_records(results, columns=columns)
+    df.to_csv(path, index=False)
+
+
 def quick_find(
     data_dir: Path = None,
     file_list_path: Path = None,
@@ -673,6 +1023,9 @@ def quick_find(
     output_dir: Path = None,
     resume: bool = False,
     mode: str = "standard",
+    min_band_power: float = None,
+    cache_dir: Path = None,
+    workers: int = None,
 ):
     """
     Quick analysis to find files with interesting chirps and click trains.
@@ -684,10 +1037,19 @@ def quick_find(
         output_dir: Where to save results
         resume: Resume from checkpoint if interrupted
         mode: 'standard' for chirps/clicks, 'unique' for exceptional features
+        min_band_power: Standard mode only. Files whose 5-150 kHz band power
+            (see band_power) falls below this are recorded with zero
+            detections without running the detectors. None disables it.
+        cache_dir: Directory for cached denoised signals, shared across runs
+            and modes (see dolphain.denoise_cached). None disables caching.
+        workers: Number of worker processes analyzing files in parallel
+            (default: os.cpu_count())
     """
     output_dir = output_dir or Path("quick_find_results")
     output_dir.mkdir(exist_ok=True)
-    checkpoint_file = output_dir / "checkpoint.json"
+    checkpoint_file = output_dir / "checkpoint.jsonl"
+    # One path per completed file; lets --resume skip parsing every result
+    done_file = output_dir / "done.txt"
 
     if mode == "unique":
         title = "🌟 UNIQUE SIGNAL DETECTION"
@@ -718,7 +1080,7 @@ def quick_find(
     print(f"Detection targets:")
     for target in targets:
         print(target)
-    if resume and checkpoint_file.exists():
+    if resume and done_file.exists():
         print("📂 Resume mode: Will continue from checkpoint")
     print()
 
@@ -757,25 +1119,22 @@ def quick_find(
 
     # Check for checkpoint
     processed_files = set()
-    results = []
     errors = []
+    counts = Counter()
 
-    if resume and checkpoint_file.exists():
+    if resume and done_file.exists():
+        # Only the done list is needed to schedule the remaining files; the
+        # checkpoint itself is replayed once at the end for the report
         print("📂 Loading checkpoint...")
-        import json
-
-        with open(checkpoint_file, "r") as f:
-            checkpoint = json.load(f)
-        results = checkpoint.get("results", [])
-        errors = checkpoint.get("errors", [])
-        processed_files = set(r["file"] for r in results)
-        processed_files.update(e["file"] for e in errors)
-        print(f"  ✓ Loaded {len(results)} completed files")
+        # (intersecting with the file list also drops a torn last line)
+        processed_files = set(done_file.read_text().splitlines())
+        processed_files.intersection_update(map(str, file_list))
+        print(f"  ✓ Found {len(processed_files)} completed files")
         print(f"  ✓ Resuming from file {len(processed_files) + 1}/{len(file_list)}\n")
 
     # Step 2: Analysis
     print("🔍 Step 2: Detecting chirps and click trains...")
-    print(f"  Will save checkpoint every 10 files (safe to interrupt!)")
+    print(f"  Checkpointing every completed file (safe to interrupt!)")
     start_time = time.time()
 
     files_to_process = [f for f in file_list if str(f) not in processed_files]
@@ -783,193 +1142,139 @@ def quick_find(
     already_done = len(processed_files)
 
     print(f"  📊 Status: {already_done}/{total_files} files already processed")
-    print(f"  🚀 Processing {len(files_to_process)} remaining files...\n")
-
-    for i, file_path in enumerate(files_to_process):
-        overall_index = already_done + i
-        try:
-            # Read and process file
-            data_dict = dolphain.read_ears_file(file_path)
-            # More aggressive denoising to remove noise before detection
-            signal_clean = dolphain.wavelet_denoise(
-                data_dict["data"],
-                wavelet="db8",
-                hard_threshold=True,  # More aggressive: hard thresholding removes more noise
-            )
-
-            if mode == "unique":
-                # Unique signal detection mode
-                unique_features = detect_unique_features(signal_clean, data_dict["fs"])
-                uniqueness_score = calculate_uniqueness_score(unique_features)
-
-                result = {
-                    "file": str(file_path),
-                    "filename": file_path.name,
-                    "recording_duration": data_dict["duration"],
-                    "interestingness_score": round(
-                        uniqueness_score, 2
-                    ),  # Use interestingness_score for compatibility
-                    "uniqueness_score": round(
-                        uniqueness_score, 2
-                    ),  # Also keep for reference
-                    "active_bands": unique_features.get("active_bands", 0),
-                    "spectral_entropy": round(
-                        unique_features.get("spectral_entropy", 0), 2
-                    ),
-                    "freq_range": round(unique_features.get("freq_range", 0), 1),
-                    "max_freq": round(unique_features.get("max_freq", 0), 1),
-                    "max_simultaneous": unique_features.get("max_simultaneous", 0),
-                    "fast_sweeps": unique_features.get("fast_sweeps", 0),
-                    "harmonics": unique_features.get("harmonics", 0),
-                    "burst_clicks": unique_features.get("burst_clicks", 0),
-                    # Add placeholder fields that showcase might expect
-                    "n_chirps": 0,  # Not detected in unique mode
-                    "n_click_trains": 0,  # Not detected in unique mode
-                    "total_clicks": 0,  # Not detected in unique mode
-                }
-            else:
-                # Standard chirp/click detection mode
-                # Detect chirps (very conservative parameters)
-                chirps = detect_chirps(
-                    signal_clean,
-                    data_dict["fs"],
-                    min_duration=0.3,  # Longer minimum duration
-                    freq_sweep_min=3000,  # Larger frequency sweep required
-                )
-
-                # Detect click trains (very conservative)
-                click_trains = detect_click_trains(
-                    signal_clean,
-                    data_dict["fs"],
-                    click_freq_range=(
-                        20000,
-                        min(data_dict["fs"] // 2, 150000),
-                    ),  # Higher frequency minimum
-                    min_clicks=15,  # More clicks required
-                    max_ici=0.05,
-                )
-
-                # Calculate statistics
-                n_chirps = len(chirps)
-                n_click_trains = len(click_trains)
-                total_clicks = sum(ct["n_clicks"] for ct in click_trains)
-
-                # Coverage calculations
-                if n_chirps > 0:
-                    chirp_duration = sum(c["duration"] for c in chirps)
-                    chirp_coverage = chirp_duration / data_dict["duration"] * 100
-                    mean_chirp_duration = chirp_duration / n_chirps
-                    mean_sweep = np.mean([c["freq_sweep"] for c in chirps])
-                else:
-                    chirp_coverage = 0.0
-                    mean_chirp_duration = 0.0
-                    mean_sweep = 0.0
-
-                if n_click_trains > 0:
-                    ct_duration = sum(ct["duration"] for ct in click_trains)
-                    ct_coverage = ct_duration / data_dict["duration"] * 100
-                    mean_ct_duration = ct_duration / n_click_trains
-                    mean_click_rate = np.mean([ct["click_rate"] for ct in click_trains])
-                    mean_ici = np.mean([ct["mean_ici"] for ct in click_trains])
-                else:
-                    ct_coverage = 0.0
-                    mean_ct_duration = 0.0
-                    mean_click_rate = 0.0
-                    mean_ici = 0.0
-
-                result = {
-                    "file": str(file_path),
-                    "filename": file_path.name,
-                    "recording_duration": data_dict["duration"],
-                    # Chirp data
-                    "n_chirps": n_chirps,
-                    "chirp_coverage_percent": chirp_coverage,
-                    "mean_chirp_duration": mean_chirp_duration,
-                    "mean_freq_sweep": mean_sweep,
-                    # Click train data
-                    "n_click_trains": n_click_trains,
-                    "total_clicks": total_clicks,
-                    "click_train_coverage_percent": ct_coverage,
-                    "mean_click_train_duration": mean_ct_duration,
-                    "mean_click_rate": mean_click_rate,
-                    "mean_ici": mean_ici,
-                }
-
-                # Calculate interestingness score
-                score = calculate_interestingness_score(
-                    result, chirps, click_trains, signal_clean, data_dict["fs"]
-                )
-                result["interestingness_score"] = round(score, 2)
+    print(
+        f"  🚀 Processing {len(files_to_process)} remaining files "
+        f"on {workers or os.cpu_count()} worker processes...\n"
+    )
 
-            results.append(result)
+    # One slot per file this session, filled in completion order (error
+    # slots stay None); avoids regrowing the list on very large runs
+    results = [None] * len(files_to_process)
+    n_results = 0
+    n_prescreened = 0
+    # Line-buffered so every completed file reaches disk immediately
+    checkpoint = open(checkpoint_file, "a" if resume else "w", buffering=1)
+    done = open(done_file, "a" if resume else "w", buffering=1)
+    for log in (checkpoint, done):
+        if log.tell() > 0:
+            # Terminate any torn last line so the next record starts cleanly
+            log.write("\n")
+    executor = ProcessPoolExecutor(max_workers=workers)
+    futures = [
+        executor.submit(analyze_file, file_path, mode, min_band_power, cache_dir)
+        for file_path in files_to_process
+    ]
+
+    # Workers take files in submission order; keep the next few queued
+    # files warm in the page cache so their reads don't stall the workers
+    reader = ThreadPoolExecutor(max_workers=1)
+    prefetch_ahead = (workers or os.cpu_count()) + 2
+    prefetches = [
+        reader.submit(warm_page_cache, file_path)
+        for file_path in files_to_process[:prefetch_ahead]
+    ]
+    next_prefetch = prefetch_ahead
 
-        except Exception as e:
-            errors.append({"file": str(file_path), "error": str(e)})
+    try:
+        for i, future in enumerate(as_completed(futures)):
+            overall_index = already_done + i
+            result, error, prescreened = future.result()
+            if result is not None:
+                results[i] = result
+                n_results += 1
+                tally_result(counts, result)
+                n_prescreened += prescreened
+                record = {"type": "result", "data": result}
+            else:
+                errors.append(error)
+                record = {"type": "error", "data": error}
 
-        # Save checkpoint every 10 files
-        if (overall_index + 1) % 10 == 0:
-            import json
+            # Append-only checkpoint: one line per completed file, then mark
+            # it done (a crash in between just re-runs that file)
+            checkpoint.write(json.dumps(record) + "\n")
+            done.write(record["data"]["file"] + "\n")
 
-            with open(checkpoint_file, "w") as f:
-                json.dump(
-                    {"results": results, "errors": errors, "last_updated": time.time()},
-                    f,
-                    indent=2,
+            if next_prefetch < len(files_to_process):
+                prefetches.append(
+                    reader.submit(warm_page_cache, files_to_process[next_prefetch])
                 )
+                next_prefetch += 1
+
+            # Progress updates every 10 files
+            if (overall_index + 1) % 10 == 0 or (overall_index + 1) == total_files:
+                elapsed = time.time() - start_time
+                files_done = overall_index + 1 - already_done
+                if files_done > 0:
+                    rate = files_done / elapsed
+                    remaining_files = total_files - overall_index - 1
+                    remaining_time = remaining_files / rate if rate > 0 else 0
+
+                    if mode == "unique":
+                        # Stats for unique mode
+                        n_high = counts["high_score"]
+                        n_harmonics = counts["with_harmonics"]
+                        n_fast = counts["with_fast_sweeps"]
+
+                        print(
+                            f"  ⏳ Progress: {overall_index + 1}/{total_files} ({(overall_index + 1)/total_files*100:.1f}%) "
+                            f"| {rate:.1f} files/s | ETA: {remaining_time/60:.1f}m"
+                        )
+                        print(
+                            f"     High scores (>70): {n_high} | Harmonics: {n_harmonics} | Fast sweeps: {n_fast}"
+                        )
+                    else:
+                        # Stats for standard mode
+                        n_with_chirps = counts["with_chirps"]
+                        n_with_clicks = counts["with_clicks"]
+                        n_with_both = counts["with_both"]
+
+                        chirp_rate = (
+                            (n_with_chirps / n_results * 100) if n_results else 0
+                        )
+                        click_rate = (
+                            (n_with_clicks / n_results * 100) if n_results else 0
+                        )
 
-        # Progress updates every 10 files
-        if (overall_index + 1) % 10 == 0 or (overall_index + 1) == total_files:
-            elapsed = time.time() - start_time
-            files_done = overall_index + 1 - already_done
-            if files_done > 0:
-                rate = files_done / elapsed
-                remaining_files = total_files - overall_index - 1
-                remaining_time = remaining_files / rate if rate > 0 else 0
-
-                if mode == "unique":
-                    # Stats for unique mode
-                    n_high = sum(
-                        1 for r in results if r.get("uniqueness_score", 0) > 70
-                    )
-                    n_harmonics = sum(1 for r in results if r.get("harmonics", 0) > 0)
-                    n_fast = sum(1 for r in results if r.get("fast_sweeps", 0) > 0)
-
-                    print(
-                        f"  ⏳ Progress: {overall_index + 1}/{total_files} ({(overall_index + 1)/total_files*100:.1f}%) "
-                        f"| {rate:.1f} files/s | ETA: {remaining_time/60:.1f}m"
-                    )
-                    print(
-                        f"     High scores (>70): {n_high} | Harmonics: {n_harmonics} | Fast sweeps: {n_fast} | Checkpoint saved ✓"
-                    )
-                else:
-                    # Stats for standard mode
-                    n_with_chirps = sum(1 for r in results if r.get("n_chirps", 0) > 0)
-                    n_with_clicks = sum(
-                        1 for r in results if r.get("n_click_trains", 0) > 0
-                    )
-                    n_with_both = sum(
-                        1
-                        for r in results
-                        if r.get("n_chirps", 0) > 0 and r.get("n_click_trains", 0) > 0
-                    )
-
-                    chirp_rate = (n_with_chirps / len(results) * 100) if results else 0
-                    click_rate = (n_with_clicks / len(results) * 100) if results else 0
-
-                    print(
-                        f"  ⏳ Progress: {overall_index + 1}/{total_files} ({(overall_index + 1)/total_files*100:.1f}%) "
-                        f"| {rate:.1f} files/s | ETA: {remaining_time/60:.1f}m"
-                    )
-                    print(
-                        f"     Chirps: {chirp_rate:.0f}% | Clicks: {click_rate:.0f}% | Both: {n_with_both} | Checkpoint saved ✓"
-                    )
+                        print(
+                            f"  ⏳ Progress: {overall_index + 1}/{total_files} ({(overall_index + 1)/total_files*100:.1f}%) "
+                            f"| {rate:.1f} files/s | ETA: {remaining_time/60:.1f}m"
+                        )
+                        print(
+                            f"     Chirps: {chirp_rate:.0f}% | Clicks: {click_rate:.0f}% | Both: {n_with_both}"
+                        )
+    finally:
+        # On Ctrl+C or early exit drop queued files; the last checkpoint lets
+        # --resume pick up from here (Future.cancel rather than 3.9's
+        # shutdown(cancel_futures=True), which 3.8 lacks)
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
+        # Drop pending prefetches too, then wait for the (short) read in
+        # flight so it never outlives the logs below
+        for prefetch in prefetches:
+            prefetch.cancel()
+        reader.shutdown()
+        checkpoint.close()
+        done.close()
+
+    if already_done:
+        # Earlier sessions' results live only in the checkpoint log
+        results, errors = dolphain.load_checkpoint(checkpoint_file)
+        counts = Counter()
+        for result in results:
+            tally_result(counts, result)
+    else:
+        results = [r for r in results if r is not None]
 
     # Clean up checkpoint on completion
-    if checkpoint_file.exists():
-        checkpoint_file.unlink()
+    for log_file in (checkpoint_file, done_file):
+        if log_file.exists():
+            log_file.unlink()
 
     print(f"\n  ✅ Completed {len(results)} files successfully")
     print(f"  Errors: {len(errors)}")
+    if min_band_power is not None:
+        print(f"  Pre-screened as noise: {n_prescreened}")
     print(f"  Time: {time.time() - start_time:.1f}s\n")
 
     # Step 3: Analyze and report
@@ -978,32 +1283,35 @@ def quick_find(
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Sort by interestingness
-    results.sort(key=lambda x: x["interestingness_score"], reverse=True)
-
     # Save full results
-    import json
-
     detection_targets = (
         ["unique_features"] if mode == "unique" else ["chirps", "click_trains"]
     )
 
-    with open(output_dir / "results.json", "w") as f:
-        json.dump(
-            {
-                "n_analyzed": len(results),
-                "n_errors": len(errors),
-                "detection_targets": detection_targets,
-                "detection_mode": mode,
-                "results": results,
-                "errors": errors,
-            },
-            f,
-            indent=2,
-        )
+    result_cols = UNIQUE_RESULT_COLS if mode == "unique" else STANDARD_RESULT_COLS
+
+    # The two large writes run on background threads while the top-20
+    # report and summary are produced; both are joined before the banner
+    io_pool = ThreadPoolExecutor(max_workers=2)
+    json_write = io_pool.submit(
+        write_results_json,
+        output_dir / "results.json",
+        {
+            "n_analyzed": len(results),
+            "n_errors": len(errors),
+            "detection_targets": detection_targets,
+            "detection_mode": mode,
+            "results": results,
+            "errors": errors,
+        },
+    )
+    csv_write = io_pool.submit(
+        write_results_csv, output_dir / "all_results.csv", results, result_cols
+    )
+    io_pool.shutdown(wait=False)
 
-    # Save top files list
-    top_20 = results[:20]
+    # Save top files list (partial selection; results stay in completion order)
+    top_20 = heapq.nlargest(20, results, key=lambda x: x["interestingness_score"])
 
     if mode == "unique":
         header_title = "TOP 20 MOST UNIQUE FILES - EXCEPTIONAL FEATURES"
@@ -1014,45 +1322,34 @@ def quick_find(
             f"{'Rank':<6} {'Score':<8} {'Chirps':<8} {'Clicks':<8} {'CT':<6} {'File'}\n"
         )
 
-    with open(output_dir / "top_20_files.txt", "w") as f:
-        f.write(header_title + "\n")
-        f.write("=" * 100 + "\n\n")
-        f.write(header_cols)
-        f.write("-" * 100 + "\n")
-
-        for i, result in enumerate(top_20, 1):
-            score = result["interestingness_score"]
-            filename = result["filename"]
-
-            if mode == "unique":
-                bands = result.get("active_bands", 0)
-                harmonics = result.get("harmonics", 0)
-                sweeps = result.get("fast_sweeps", 0)
-                f.write(
-                    f"{i:<6} {score:<8.1f} {bands:<7} {harmonics:<10} {sweeps:<8} {filename}\n"
-                )
-            else:
-                chirps = result.get("n_chirps", 0)
-                clicks = result.get("total_clicks", 0)
-                ct = result.get("n_click_trains", 0)
-                f.write(
-                    f"{i:<6} {score:<8.1f} {chirps:<8} {clicks:<8} {ct:<6} {filename}\n"
-                )
+    lines = [header_title + "\n", "=" * 100 + "\n\n", header_cols, "-" * 100 + "\n"]
 
-        f.write("\n\nFull file paths:\n")
-        f.write("-" * 100 + "\n")
-        for i, result in enumerate(top_20, 1):
-            f.write(f"{i}. {result['file']}\n")
+    for i, result in enumerate(top_20, 1):
+        score = result["interestingness_score"]
+        filename = result["filename"]
 
-    # Save CSV for analysis
-    import pandas as pd
+        if mode == "unique":
+            bands = result.get("active_bands", 0)
+            harmonics = result.get("harmonics", 0)
+            sweeps = result.get("fast_sweeps", 0)
+            lines.append(
+                f"{i:<6} {score:<8.1f} {bands:<7} {harmonics:<10} {sweeps:<8} {filename}\n"
+            )
+        else:
+            chirps = result.get("n_chirps", 0)
+            clicks = result.get("total_clicks", 0)
+            ct = result.get("n_click_trains", 0)
+            lines.append(
+                f"{i:<6} {score:<8.1f} {chirps:<8} {clicks:<8} {ct:<6} {filename}\n"
+            )
 
-    df = pd.DataFrame(results)
-    df.to_csv(output_dir / "all_results.csv", index=False)
+    lines.append("\n\nFull file paths:\n")
+    lines.append("-" * 100 + "\n")
+    lines.extend(f"{i}. {result['file']}\n" for i, result in enumerate(top_20, 1))
 
-    print(f"  ✓ Saved: {output_dir}/results.json")
+    # One write for the whole report
+    (output_dir / "top_20_files.txt").write_text("".join(lines))
     print(f"  ✓ Saved: {output_dir}/top_20_files.txt")
-    print(f"  ✓ Saved: {output_dir}/all_results.csv")
 
     # Print summary
     print("\n" + "=" * 80)
@@ -1062,10 +1359,10 @@ def quick_find(
 
     if mode == "unique":
         # Summary for unique mode
-        n_high_score = sum(1 for r in results if r.get("interestingness_score", 0) > 70)
-        n_with_harmonics = sum(1 for r in results if r.get("harmonics", 0) > 0)
-        n_with_fast_sweeps = sum(1 for r in results if r.get("fast_sweeps", 0) > 0)
-        n_multi_band = sum(1 for r in results if r.get("active_bands", 0) >= 4)
+        n_high_score = counts["high_score"]
+        n_with_harmonics = counts["with_harmonics"]
+        n_with_fast_sweeps = counts["with_fast_sweeps"]
+        n_multi_band = counts["multi_band"]
 
         print(
             f"High uniqueness (>70): {n_high_score} ({n_high_score/len(results)*100:.1f}%)"
@@ -1080,12 +1377,12 @@ def quick_find(
             f"Files with 4+ bands: {n_multi_band} ({n_multi_band/len(results)*100:.1f}%)"
         )
 
-        avg_score = np.mean([r.get("interestingness_score", 0) for r in results])
+        avg_score = counts["score_total"] / len(results)
         print(f"Average uniqueness score: {avg_score:.1f}")
         print()
 
         print("TOP 5 MOST UNIQUE FILES:")
-        for i, result in enumerate(results[:5], 1):
+        for i, result in enumerate(top_20[:5], 1):
             score = result["interestingness_score"]
             bands = result.get("active_bands", 0)
             harmonics = result.get("harmonics", 0)
@@ -1096,13 +1393,9 @@ def quick_find(
             print(f"     {result['filename']}")
     else:
         # Summary for standard mode
-        n_with_chirps = sum(1 for r in results if r.get("n_chirps", 0) > 0)
-        n_with_clicks = sum(1 for r in results if r.get("n_click_trains", 0) > 0)
-        n_with_both = sum(
-            1
-            for r in results
-            if r.get("n_chirps", 0) > 0 and r.get("n_click_trains", 0) > 0
-        )
+        n_with_chirps = counts["with_chirps"]
+        n_with_clicks = counts["with_clicks"]
+        n_with_both = counts["with_both"]
 
         print(
             f"Files with chirps: {n_with_chirps} ({n_with_chirps/len(results)*100:.1f}%)"
@@ -1112,9 +1405,9 @@ def quick_find(
         )
         print(f"Files with both: {n_with_both} ({n_with_both/len(results)*100:.1f}%)")
 
-        total_chirps = sum(r.get("n_chirps", 0) for r in results)
-        total_click_trains = sum(r.get("n_click_trains", 0) for r in results)
-        total_clicks = sum(r.get("total_clicks", 0) for r in results)
+        total_chirps = counts["chirps"]
+        total_click_trains = counts["click_trains"]
+        total_clicks = counts["clicks"]
 
         print(f"Total chirps detected: {total_chirps}")
         print(f"Total click trains detected: {total_click_trains}")
@@ -1122,7 +1415,7 @@ def quick_find(
         print()
 
         print("TOP 5 FILES:")
-        for i, result in enumerate(results[:5], 1):
+        for i, result in enumerate(top_20[:5], 1):
             score = result["interestingness_score"]
             chirps = result.get("n_chirps", 0)
             clicks = result.get("total_clicks", 0)
@@ -1132,6 +1425,12 @@ def quick_find(
             )
             print(f"     {result['filename']}")
 
+    # Join the background writes (re-raises any write error)
+    json_write.result()
+    print(f"\n  ✓ Saved: {output_dir}/results.json")
+    csv_write.result()
+    print(f"  ✓ Saved: {output_dir}/all_results.csv")
+
     print("\n" + "=" * 80)
     print("✅ QUICK FIND COMPLETE!")
     print("=" * 80)
@@ -1168,7 +1467,7 @@ Detection Modes:
   standard: Chirps (frequency sweeps) and click trains (echolocation)
   unique:   Exceptional features (fast sweeps, harmonics, rare frequencies, etc.)
 
-Note: Checkpoints are saved every 10 files, so you can safely interrupt (Ctrl+C) 
+Note: Every completed file is checkpointed, so you can safely interrupt (Ctrl+C)
       and resume later with --resume flag!
         """,
     )
@@ -1193,6 +1492,26 @@ Note: Checkpoints are saved every 10 files, so you can safely interrupt (Ctrl+C)
     parser.add_argument(
         "--resume", action="store_true", help="Resume from checkpoint if interrupted"
     )
+    parser.add_argument(
+        "--min-band-power",
+        type=float,
+        default=None,
+        help="Standard mode: skip detection for files whose 5-150 kHz band power "
+        "is below this value (calibrate on a small sample; default: disabled)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache denoised signals here and reuse them on later runs "
+        "(e.g. standard then unique mode); ~8 bytes per sample on disk",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for parallel analysis (default: all CPU cores)",
+    )
     parser.add_argument(
         "--mode",
         type=str,
@@ -1227,6 +1546,9 @@ Note: Checkpoints are saved every 10 files, so you can safely interrupt (Ctrl+C)
         output_dir=args.output_dir,
         resume=args.resume,
         mode=args.mode,
+        min_band_power=args.min_band_power,
+        cache_dir=args.cache_dir,
+        workers=args.workers,
     )
 
 
@@ -12,6 +12,7 @@ Usage:
     python refresh_showcase.py --results-dir CLICK_CHIRP_001 --top 20 --output site/showcase_v2
 """
 
+import os
 import sys
 import argparse
 import json
@@ -40,15 +41,38 @@ def clean_showcase_dir(showcase_dir):
             shutil.rmtree(subdir_path)
             print(f"     Removed: {subdir}/")
 
-    # Remove JSON files but keep index.html
-    for json_file in showcase_dir.glob("*.json"):
-        json_file.unlink()
-        print(f"     Removed: {json_file.name}")
+    # Remove JSON files but keep index.html (scandir avoids glob's
+    # per-entry Path construction on large showcase directories)
+    with os.scandir(showcase_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                os.unlink(entry.path)
+                print(f"     Removed: {entry.name}")
 
     print(f"  ✓ Showcase cleaned")
 
 
-def refresh_showcase(results_dir, top_n=15, output_dir="site/showcase"):
+def run_streamed(cmd):
+    """
+    Run a command, echoing its combined stdout/stderr line by line.
+
+    Returns the exit code.
+    """
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+    ) as proc:
+        for line in proc.stdout:
+            print(line, end="")
+        return proc.wait()
+
+
+def list_results_dir(results_dir):
+    """Names of the entries in a results directory, from a single scan."""
+    with os.scandir(results_dir) as entries:
+        return {entry.name for entry in entries}
+
+
+def refresh_showcase(results_dir, top_n=15, output_dir="site/showcase", names=None):
     """
     Refresh showcase with top N files from quick_find results.
 
@@ -56,9 +80,14 @@ def refresh_showcase(results_dir, top_n=15, output_dir="site/showcase"):
         results_dir: Directory containing quick_find results (e.g., CLICK_CHIRP_001)
         top_n: Number of top files to include in showcase
         output_dir: Showcase output directory
+        names: Entry names in results_dir, if already listed (see
+            list_results_dir); scanned here otherwise
     """
     results_dir = Path(results_dir)
     output_dir = Path(output_dir)
+    if names is None:
+        names = list_results_dir(results_dir)
+    has_results = "results.json" in names
 
     print("=" * 80)
     print("🎨 REFRESH SHOWCASE")
@@ -71,23 +100,21 @@ def refresh_showcase(results_dir, top_n=15, output_dir="site/showcase"):
     # Step 1: Load results
     print("📋 Step 1: Loading results...")
     results_file = results_dir / "results.json"
-    checkpoint_file = results_dir / "checkpoint.json"
+    checkpoint_file = results_dir / "checkpoint.jsonl"
 
     # Try results.json first (final results)
-    if results_file.exists():
+    if has_results:
         print(f"  Loading final results: {results_file}")
         with open(results_file, "r") as f:
             data = json.load(f)
         results = data.get("results", [])
         print(f"  ✓ Loaded {len(results)} results (complete run)")
 
-    # Fall back to checkpoint.json if results.json doesn't exist
-    elif checkpoint_file.exists():
+    # Fall back to checkpoint.jsonl if results.json doesn't exist
+    elif "checkpoint.jsonl" in names:
         print(f"  ⚠️  Final results not found, using checkpoint: {checkpoint_file}")
         print(f"     (Analysis appears to be in progress)")
-        with open(checkpoint_file, "r") as f:
-            data = json.load(f)
-        results = data.get("results", [])
+        results, _ = dolphain.load_checkpoint(checkpoint_file)
         print(f"  ✓ Loaded {len(results)} results so far (partial run)")
 
         # Sort by interestingness_score (checkpoint may not be sorted)
@@ -117,15 +144,17 @@ def refresh_showcase(results_dir, top_n=15, output_dir="site/showcase"):
     print("🎬 Step 3: Generating showcase...")
     print(f"  Running generate_showcase.py...")
 
-    # Determine which file to use for showcase generation
-    if results_file.exists():
+    # Use the same source as Step 1
+    if has_results:
         checkpoint_path = results_file
     else:
         checkpoint_path = checkpoint_file
 
     # Build command - generate_showcase.py expects a checkpoint JSON file
+    # (-u so the child's progress lines arrive as they are printed)
     cmd = [
         sys.executable,
+        "-u",
         "scripts/generate_showcase.py",
         "--checkpoint",
         str(checkpoint_path),
@@ -136,29 +165,22 @@ def refresh_showcase(results_dir, top_n=15, output_dir="site/showcase"):
     ]
 
     # Run showcase generation
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
+    if run_streamed(cmd) != 0:
         print(f"  ❌ Showcase generation failed!")
-        print(result.stderr)
         return False
 
-    print(result.stdout)
-
     # Step 4: Convert to MP3
     print("🎵 Step 4: Converting audio to MP3...")
     mp3_cmd = [
         sys.executable,
+        "-u",
         "scripts/convert_to_mp3.py",
         "--showcase-dir",
         str(output_dir),
     ]
 
-    result = subprocess.run(mp3_cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"  ⚠️  MP3 conversion had issues (may be okay):")
-        print(result.stderr)
+    if run_streamed(mp3_cmd) != 0:
+        print(f"  ⚠️  MP3 conversion had issues (may be okay, see output above)")
     else:
         print(f"  ✓ MP3 conversion complete")
 
@@ -174,77 +196,6 @@ def refresh_showcase(results_dir, top_n=15, output_dir="site/showcase"):
 
     return True
 
-    # Step 5: Convert to MP3
-    print("🎵 Step 5: Converting audio to MP3...")
-    mp3_cmd = [
-        sys.executable,
-        "scripts/convert_to_mp3.py",
-        "--showcase-dir",
-        str(output_dir),
-    ]
-
-    result = subprocess.run(mp3_cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"  ⚠️  MP3 conversion had issues (may be okay):")
-        print(result.stderr)
-    else:
-        print(f"  ✓ MP3 conversion complete")
-
-    print()
-
-    # Step 6: Summary
-    print("=" * 80)
-    print("✅ SHOWCASE REFRESH COMPLETE!")
-    print("=" * 80)
-
-    # Create a metadata file about this showcase
-    metadata = {
-        "source": str(results_dir),
-        "top_n": top_n,
-        "generated_from": "refresh_showcase.py",
-        "detection_type": data.get("detection_targets", ["chirps", "click_trains"]),
-        "n_analyzed": data.get("n_analyzed", len(results)),
-        "files": [
-            {
-                "rank": i + 1,
-                "filename": r["filename"],
-                "score": r["interestingness_score"],
-                "n_chirps": r.get("n_chirps", 0),
-                "n_click_trains": r.get("n_click_trains", 0),
-                "total_clicks": r.get("total_clicks", 0),
-            }
-            for i, r in enumerate(top_files)
-        ],
-    }
-
-    metadata_file = output_dir / "showcase_metadata.json"
-    with open(metadata_file, "w") as f:
-        json.dump(metadata, f, indent=2)
-
-    print(f"\nShowcase created at: {output_dir}/")
-    print(f"Metadata saved to: {metadata_file}")
-    print(f"\nTop 5 files in showcase:")
-    for i, r in enumerate(top_files[:5], 1):
-        score = r["interestingness_score"]
-        chirps = r.get("n_chirps", 0)
-        clicks = r.get("total_clicks", 0)
-        print(
-            f"  {i}. {r['filename']} - Score: {score:.1f} (Chirps: {chirps}, Clicks: {clicks})"
-        )
-
-    print(f"\nTo view:")
-    print(f"  cd site && python3 -m http.server 8000")
-    print(f"  Then open: http://localhost:8000/showcase.html")
-
-    # Clean up temp directory if used
-    if copy_files and Path("temp_showcase_files").exists():
-        print(f"\n🧹 Cleaning up temp files...")
-        shutil.rmtree("temp_showcase_files")
-        print(f"  ✓ Removed temp_showcase_files/")
-
-    return True
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -286,30 +237,32 @@ Note: This will delete all files in the showcase directory before regenerating!
 
     args = parser.parse_args()
 
-    # Validate
-    if not args.results_dir.exists():
+    # Validate (one directory scan answers every existence check below)
+    try:
+        names = list_results_dir(args.results_dir)
+    except (FileNotFoundError, NotADirectoryError):
         print(f"❌ Error: Results directory not found: {args.results_dir}")
         print(f"   Make sure quick_find has been run and completed.")
         sys.exit(1)
 
-    # Check for results.json or checkpoint.json
-    results_file = args.results_dir / "results.json"
-    checkpoint_file = args.results_dir / "checkpoint.json"
-
-    if not results_file.exists() and not checkpoint_file.exists():
+    # Check for results.json or checkpoint.jsonl
+    if "results.json" not in names and "checkpoint.jsonl" not in names:
         print(f"❌ Error: No results found in {args.results_dir}")
-        print(f"   Neither results.json nor checkpoint.json exists.")
+        print(f"   Neither results.json nor checkpoint.jsonl exists.")
         print(f"   Has quick_find been started yet?")
         sys.exit(1)
 
-    if not results_file.exists():
+    if "results.json" not in names:
         print(f"⚠️  Using checkpoint data (analysis in progress)")
-        print(f"   Will use top {args.top} files from checkpoint.json")
+        print(f"   Will use top {args.top} files from checkpoint.jsonl")
         print()
 
     # Run
     success = refresh_showcase(
-        results_dir=args.results_dir, top_n=args.top, output_dir=args.output
+        results_dir=args.results_dir,
+        top_n=args.top,
+        output_dir=args.output,
+        names=names,
     )
 
     sys.exit(0 if success else 1)
@@ -13,7 +13,7 @@ import numpy as np
 
 def simple_pipeline(filepath):
     """Simple test pipeline."""
-    data = dolphain.read_ears_file(filepath)
+    data = dolphain.read_ears_file_mmap(filepath)
     return {
         "duration": data["duration"],
         "rms": np.sqrt(np.mean(data["data"] ** 2)),
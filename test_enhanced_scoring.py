@@ -3,19 +3,99 @@
 Test enhanced interestingness scoring on a few files.
 """
 
+import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
 import json
 import numpy as np
+from scipy.fft import next_fast_len, rfft, rfftfreq
 
 sys.path.insert(0, str(Path(__file__).parent))
 import dolphain
 
 
-def calculate_enhanced_interestingness(result, whistles, signal_clean, fs):
+@lru_cache(maxsize=8)
+def snr_band_masks(n, fs):
+    """
+    Whistle-band and noise-band masks for an n-point rfft.
+
+    Cached per (n, fs): recordings share a handful of lengths, so the
+    bins and masks are built once rather than on every scoring call.
+    """
+    freq_bins = rfftfreq(n, 1 / fs)
+    whistle_mask = (freq_bins >= 5000) & (freq_bins <= 25000)
+    noise_mask = (freq_bins >= 1000) & (freq_bins <= 5000)
+    whistle_mask.flags.writeable = False
+    noise_mask.flags.writeable = False
+    return whistle_mask, noise_mask
+
+
+# Display precision per feature; anything not listed is shown to 2 places
+FEATURE_DECIMALS = {
+    "freq_range_hz": 1,
+    "duration_std": 3,
+    "snr_db": 1,
+    "mean_fm_rate": 1,
+}
+
+
+def rounded_features(features):
+    """Copy of features rounded for display (scoring keeps full precision)."""
+    return {k: round(v, FEATURE_DECIMALS.get(k, 2)) for k, v in features.items()}
+
+
+def fm_rates(freq_arrays):
+    """
+    Mean absolute frequency step of each contour in freq_arrays.
+
+    Pure array-in/array-out so the FM maths stays separate from the
+    whistle-dict bookkeeping in the scoring function. Contours are stacked
+    into one 2-D array, each padded with its own last value so the padding
+    adds zero steps, and differenced in a single call.
+    """
+    lens = np.fromiter(map(len, freq_arrays), dtype=np.intp, count=len(freq_arrays))
+    stacked = np.empty((len(freq_arrays), lens.max()))
+    for row, freq, n in zip(stacked, freq_arrays, lens):
+        row[:n] = freq
+        row[n:] = freq[-1]
+    return np.abs(np.diff(stacked, axis=1)).sum(axis=1) / (lens - 1)
+
+
+def whistle_band_spectra(bands):
+    """
+    Power spectra of decimated whistle-band signals, batched by length.
+
+    Equal-length bands are stacked and transformed in one 2-D rfft, which
+    lets scipy.fft spread the batch over all cores (its workers only split
+    work across transforms, never within one). Returns a list of
+    (n_fft, power_spectrum) pairs in input order.
+    """
+    spectra = [None] * len(bands)
+    by_length = {}
+    for i, band in enumerate(bands):
+        by_length.setdefault(len(band), []).append(i)
+
+    for length, indices in by_length.items():
+        # Zero-pad to a fast FFT length; odd or prime lengths are far slower
+        n_fft = next_fast_len(length, real=True)
+        batch = np.stack([bands[i] for i in indices])
+        fft = rfft(batch, n=n_fft, axis=-1, workers=-1)
+        power = fft.real**2 + fft.imag**2
+        for row, i in enumerate(indices):
+            spectra[i] = (n_fft, power[row])
+    return spectra
+
+
+def calculate_enhanced_interestingness(
+    result, whistles, signal_clean, fs, spectrum=None
+):
     """
     Calculate enhanced interestingness score with multiple features.
 
+    spectrum, if given, is this file's (n_fft, power_spectrum) entry from
+    whistle_band_spectra() and signal_clean is not used.
+
     Features considered:
     1. Whistle count and coverage (basic)
     2. Whistle diversity (frequency and duration variety)
@@ -26,6 +106,19 @@ def calculate_enhanced_interestingness(result, whistles, signal_clean, fs):
     score = 0.0
     features = {}
 
+    # One pass over the whistle dicts fills the per-whistle arrays shared by
+    # the diversity, activity-pattern and overlap features below
+    n = len(whistles) if whistles else 0
+    freqs = np.empty(n)
+    durations = np.empty(n)
+    starts = np.empty(n)
+    ends = np.empty(n)
+    for i, w in enumerate(whistles or ()):
+        freqs[i] = w.get("mean_freq", 0)
+        durations[i] = w.get("duration", 0)
+        starts[i] = w["start_time"]
+        ends[i] = w["end_time"]
+
     # === FEATURE 1: Basic Whistle Activity (30 points) ===
     n_whistles = result.get("n_whistles", 0)
     coverage = result.get("whistle_coverage_percent", 0)
@@ -33,31 +126,29 @@ def calculate_enhanced_interestingness(result, whistles, signal_clean, fs):
     # Whistle count (0-15 pts): Diminishing returns after 30 whistles
     whistle_score = min(15, (n_whistles / 30) * 15)
     score += whistle_score
-    features["whistle_count_score"] = round(whistle_score, 2)
+    features["whistle_count_score"] = whistle_score
 
     # Coverage (0-15 pts): Percentage of time with whistles
     coverage_score = min(15, coverage * 0.15)
     score += coverage_score
-    features["coverage_score"] = round(coverage_score, 2)
+    features["coverage_score"] = coverage_score
 
     # === FEATURE 2: Whistle Diversity (20 points) ===
     if whistles and len(whistles) >= 2:
         # Frequency diversity
-        freqs = [w.get("mean_freq", 0) for w in whistles]
-        freq_std = np.std(freqs)
-        freq_range = np.max(freqs) - np.min(freqs) if freqs else 0
+        freq_std = freqs.std()
+        freq_range = np.ptp(freqs)
         freq_diversity = min(10, (freq_range / 10000) * 10)  # 0-10 pts
 
         # Duration diversity
-        durations = [w.get("duration", 0) for w in whistles]
-        dur_std = np.std(durations)
+        dur_std = durations.std()
         dur_diversity = min(10, dur_std * 20)  # 0-10 pts
 
         diversity_score = freq_diversity + dur_diversity
         score += diversity_score
-        features["diversity_score"] = round(diversity_score, 2)
-        features["freq_range_hz"] = round(freq_range, 1)
-        features["duration_std"] = round(dur_std, 3)
+        features["diversity_score"] = diversity_score
+        features["freq_range_hz"] = freq_range
+        features["duration_std"] = dur_std
     else:
         features["diversity_score"] = 0
 
@@ -65,14 +156,13 @@ def calculate_enhanced_interestingness(result, whistles, signal_clean, fs):
     # Estimate SNR by comparing whistle band power to noise floor
     try:
         # Power in whistle band (5-25 kHz)
-        whistle_band = signal_clean[::10]  # Downsample for speed
-        fft = np.fft.rfft(whistle_band)
-        power_spectrum = np.abs(fft) ** 2
+        if spectrum is None:
+            whistle_band = signal_clean[::10]  # Downsample for speed
+            spectrum = whistle_band_spectra([whistle_band])[0]
+        n_fft, power_spectrum = spectrum
 
         # Simplified SNR estimate
-        freq_bins = np.fft.rfftfreq(len(whistle_band), 1 / fs)
-        whistle_mask = (freq_bins >= 5000) & (freq_bins <= 25000)
-        noise_mask = (freq_bins >= 1000) & (freq_bins <= 5000)
+        whistle_mask, noise_mask = snr_band_masks(n_fft, fs)
 
         if np.any(whistle_mask) and np.any(noise_mask):
             signal_power = np.mean(power_spectrum[whistle_mask])
@@ -82,8 +172,8 @@ def calculate_enhanced_interestingness(result, whistles, signal_clean, fs):
             # 0-15 pts based on SNR (typically 0-30 dB)
             snr_score = min(15, max(0, (snr / 30) * 15))
             score += snr_score
-            features["snr_db"] = round(snr, 1)
-            features["snr_score"] = round(snr_score, 2)
+            features["snr_db"] = snr
+            features["snr_score"] = snr_score
         else:
             features["snr_score"] = 0
     except:
@@ -92,22 +182,20 @@ def calculate_enhanced_interestingness(result, whistles, signal_clean, fs):
     # === FEATURE 4: Whistle Complexity (15 points) ===
     if whistles and len(whistles) > 0:
         # Look for frequency modulation (FM) complexity
-        fm_scores = []
-        for w in whistles[:10]:  # Check up to 10 whistles
-            if "frequency" in w and len(w["frequency"]) > 3:
-                freqs = w["frequency"]
-                # Measure frequency variation (FM rate)
-                freq_diff = np.abs(np.diff(freqs))
-                fm_rate = np.mean(freq_diff) if len(freq_diff) > 0 else 0
-                fm_scores.append(fm_rate)
-
-        if fm_scores:
-            mean_fm = np.mean(fm_scores)
+        contours = [
+            w["frequency"]
+            for w in whistles[:10]  # Check up to 10 whistles
+            if "frequency" in w and len(w["frequency"]) > 3
+        ]
+
+        if contours:
+            # Measure frequency variation (FM rate)
+            mean_fm = fm_rates(contours).mean()
             # 0-15 pts: More modulation = more complex = more interesting
             complexity_score = min(15, (mean_fm / 500) * 15)  # 500 Hz typical FM
             score += complexity_score
-            features["complexity_score"] = round(complexity_score, 2)
-            features["mean_fm_rate"] = round(mean_fm, 1)
+            features["complexity_score"] = complexity_score
+            features["mean_fm_rate"] = mean_fm
         else:
             features["complexity_score"] = 0
     else:
@@ -115,14 +203,15 @@ def calculate_enhanced_interestingness(result, whistles, signal_clean, fs):
 
     # === FEATURE 5: Activity Patterns (20 points) ===
     if whistles and len(whistles) >= 3:
-        # Check temporal distribution
-        start_times = np.array([w["start_time"] for w in whistles])
-
         # Clustering: Are whistles in bursts or evenly spread?
-        gaps = np.diff(sorted(start_times))
+        sorted_starts = np.sort(starts)
+        gaps = np.diff(sorted_starts)
         if len(gaps) > 0:
-            gap_std = np.std(gaps)
-            mean_gap = np.mean(gaps)
+            # Consecutive gaps telescope, so their mean is span / count; the
+            # std then reuses it instead of averaging the gaps a second time
+            mean_gap = (sorted_starts[-1] - sorted_starts[0]) / len(gaps)
+            deviations = gaps - mean_gap
+            gap_std = np.sqrt(np.dot(deviations, deviations) / len(gaps))
 
             # Bursting pattern (low gap variance) = interesting
             burst_score = min(10, (1.0 / (gap_std + 0.01)) * 2)
@@ -132,8 +221,8 @@ def calculate_enhanced_interestingness(result, whistles, signal_clean, fs):
 
             pattern_score = burst_score + sustained_score
             score += pattern_score
-            features["pattern_score"] = round(pattern_score, 2)
-            features["mean_gap_s"] = round(mean_gap, 2)
+            features["pattern_score"] = pattern_score
+            features["mean_gap_s"] = mean_gap
         else:
             features["pattern_score"] = 0
     else:
@@ -141,49 +230,63 @@ def calculate_enhanced_interestingness(result, whistles, signal_clean, fs):
 
     # === BONUS: Multi-whistle overlaps (up to 10 points) ===
     if whistles and len(whistles) >= 2:
-        # Check for simultaneous whistles (possible multiple dolphins)
-        overlaps = 0
-        for i, w1 in enumerate(whistles[:-1]):
-            for w2 in whistles[i + 1 :]:
-                if (
-                    w1["start_time"] <= w2["end_time"]
-                    and w2["start_time"] <= w1["end_time"]
-                ):
-                    overlaps += 1
+        # Check for simultaneous whistles (possible multiple dolphins).
+        # Overlapping pairs = all pairs - disjoint pairs, and a pair is
+        # disjoint when one whistle ends before the other starts, so
+        # counting ends before each start is one O(N log N) searchsorted
+        sorted_ends = np.sort(ends)
+        disjoint = int(np.searchsorted(sorted_ends, starts, side="left").sum())
+        overlaps = n * (n - 1) // 2 - disjoint
 
         overlap_score = min(10, overlaps * 2)
         score += overlap_score
-        features["overlap_bonus"] = round(overlap_score, 2)
+        features["overlap_bonus"] = overlap_score
         features["n_overlaps"] = overlaps
     else:
         features["overlap_bonus"] = 0
 
-    features["total_score"] = round(score, 2)
+    features["total_score"] = score
     return score, features
 
 
-def test_enhanced_scoring():
-    """Test on a few files to see the difference."""
+def test_enhanced_scoring(cache_dir=None):
+    """
+    Test on a few files to see the difference.
+
+    With a cache_dir, denoising and detection results are reused between
+    runs (see dolphain.load_processed_file).
+    """
     print("=" * 80)
     print("🧪 TESTING ENHANCED INTERESTINGNESS SCORING")
     print("=" * 80)
     print()
 
     # Load some files from checkpoint
-    checkpoint = Path("outputs/results/large_run/checkpoint.json")
+    checkpoint = Path("outputs/results/large_run/checkpoint.jsonl")
     if not checkpoint.exists():
-        checkpoint = Path("quick_find_results/checkpoint.json")
+        checkpoint = Path("quick_find_results/checkpoint.jsonl")
 
+    # Only the first 10 results are needed, so stop parsing once we have them
+    # rather than decoding the whole (potentially huge) checkpoint
+    results = []
     with open(checkpoint) as f:
-        data = json.load(f)
-
-    results = data["results"][:10]  # Test on first 10
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record["type"] == "result":
+                results.append(record["data"])
+                if len(results) == 10:
+                    break
 
     print(f"Testing on {len(results)} files...")
     print()
 
     comparisons = []
 
+    # Pass 1: read and process each file, keeping only its whistles and the
+    # decimated band the SNR feature needs (not the full-length signal)
+    loaded = []
     for result in results:
         file_path = Path(result["file"])
         if not file_path.exists():
@@ -192,21 +295,29 @@ def test_enhanced_scoring():
         print(f"Processing: {file_path.name}")
 
         # Read and process
-        data_dict = dolphain.read_ears_file(file_path)
-        signal_clean = dolphain.wavelet_denoise(data_dict["data"])
-        whistles = dolphain.detect_whistles(signal_clean, data_dict["fs"])
+        data_dict, signal_clean, whistles = dolphain.load_processed_file(
+            file_path, cache_dir=cache_dir
+        )
+        band = signal_clean[::10].copy()  # Downsample for speed
+        loaded.append((result, file_path, whistles, band, data_dict["fs"]))
+    print()
+
+    # Pass 2: one batched FFT covers every file's SNR band
+    spectra = whistle_band_spectra([band for _, _, _, band, _ in loaded])
 
+    for (result, file_path, whistles, _, fs), spectrum in zip(loaded, spectra):
         # Calculate old score
         old_score = result.get("interestingness_score", 0)
 
         # Calculate new score
         new_score, features = calculate_enhanced_interestingness(
-            result, whistles, signal_clean, data_dict["fs"]
+            result, whistles, None, fs, spectrum=spectrum
         )
 
+        print(f"{file_path.name}")
         print(f"  Old score: {old_score:.1f}")
         print(f"  New score: {new_score:.1f}")
-        print(f"  Features: {features}")
+        print(f"  Features: {rounded_features(features)}")
         print()
 
         comparisons.append(
@@ -241,4 +352,13 @@ def test_enhanced_scoring():
 
 
 if __name__ == "__main__":
-    test_enhanced_scoring()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache denoised signals and detections here and reuse them on "
+        "later runs; ~8 bytes per sample on disk",
+    )
+    args = parser.parse_args()
+    test_enhanced_scoring(cache_dir=args.cache_dir)
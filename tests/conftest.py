@@ -0,0 +1,17 @@
+"""Shared pytest fixtures for the dolphain test suite."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import dolphain
+
+
+@pytest.fixture(scope="session")
+def all_files():
+    """All .210 files under data/, scanned once per test session."""
+    return dolphain.find_data_files("data", "**/*.210")
@@ -6,6 +6,7 @@ Run with pytest:
     pytest tests/test_batch.py -v
 """
 
+import json
 import pytest
 import numpy as np
 from pathlib import Path
@@ -27,15 +28,12 @@ class TestDataDiscovery:
         assert all(f.suffix == ".210" for f in files)
         assert all(f.exists() for f in files)
 
-    def test_find_data_files_recursive(self):
+    def test_find_data_files_recursive(self, all_files):
         """Test recursive file finding."""
-        files = dolphain.find_data_files("data", "**/*.210")
-        assert len(files) > 0
+        assert len(all_files) > 0
 
-    def test_select_random_files(self):
+    def test_select_random_files(self, all_files):
         """Test random file selection with reproducibility."""
-        all_files = dolphain.find_data_files("data", "**/*.210")
-
         # Test reproducibility with seed
         subset1 = dolphain.select_random_files(all_files, n=5, seed=42)
         subset2 = dolphain.select_random_files(all_files, n=5, seed=42)
@@ -45,10 +43,8 @@ class TestDataDiscovery:
         subset3 = dolphain.select_random_files(all_files, n=5, seed=123)
         assert subset1 != subset3
 
-    def test_select_random_files_size(self):
+    def test_select_random_files_size(self, all_files):
         """Test that selection returns correct number of files."""
-        all_files = dolphain.find_data_files("data", "**/*.210")
-
         for n in [1, 5, 10]:
             subset = dolphain.select_random_files(all_files, n=n, seed=42)
             assert len(subset) == min(n, len(all_files))
@@ -149,11 +145,10 @@ class TestResultCollector:
 class TestBatchProcessor:
     """Test batch processing."""
 
-    @pytest.fixture
-    def sample_files(self):
+    @pytest.fixture(scope="session")
+    def sample_files(self, all_files):
         """Get sample files for testing."""
-        files = dolphain.find_data_files("data", "**/*.210")
-        return dolphain.select_random_files(files, n=3, seed=42)
+        return dolphain.select_random_files(all_files, n=3, seed=42)
 
     @pytest.fixture
     def simple_pipeline(self):
@@ -207,13 +202,108 @@ class TestBatchProcessor:
         assert total <= 2
 
 
+@pytest.fixture
+def ears_file(tmp_path):
+    """Write a small synthetic EARS file (512-byte records, 250 samples)."""
+    rng = np.random.default_rng(0)
+    records = []
+    for i in range(200):
+        header = bytes(6) + bytes([14, 0, 0, 0, 0, i // 10])
+        samples = (rng.normal(0, 100, 250)).astype(">i2").tobytes()
+        records.append(header + samples + bytes(512 - 12 - 500))
+    path = tmp_path / "71621DC7.190"
+    path.write_bytes(b"".join(records))
+    return path
+
+
+class TestReadEarsFileMmap:
+    """Test the memory-mapped EARS reader."""
+
+    def test_matches_read_ears_file(self, ears_file):
+        """Test that both readers return identical data and metadata."""
+        expected = dolphain.read_ears_file(ears_file)
+        result = dolphain.read_ears_file_mmap(ears_file)
+
+        assert result.keys() == expected.keys()
+        np.testing.assert_array_equal(result["data"], expected["data"])
+        assert len(result["timestamps"]) == 20
+        for key in ["fs", "time_start", "time_end", "timestamps", "duration"]:
+            assert result[key] == expected[key]
+
+
+class TestLoadProcessedFile:
+    """Test cached denoising and whistle detection."""
+
+    def test_cache_roundtrip(self, ears_file, tmp_path):
+        """Test that a second call is served from the cache."""
+        cache_dir = tmp_path / "cache"
+        data, clean, whistles = dolphain.load_processed_file(
+            ears_file, wavelet="db8", cache_dir=cache_dir
+        )
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+        data2, clean2, whistles2 = dolphain.load_processed_file(
+            ears_file, wavelet="db8", cache_dir=cache_dir
+        )
+        assert data2["n_samples"] == data["n_samples"]
+        np.testing.assert_array_equal(clean2, clean)
+        assert len(whistles2) == len(whistles)
+
+    def test_cache_keyed_on_params(self, ears_file, tmp_path):
+        """Test that changing a parameter creates a new cache entry."""
+        cache_dir = tmp_path / "cache"
+        dolphain.load_processed_file(ears_file, cache_dir=cache_dir)
+        dolphain.load_processed_file(ears_file, cache_dir=cache_dir, min_duration=0.2)
+        assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+    def test_cache_disabled_by_default(self, ears_file, tmp_path, monkeypatch):
+        """Test that without cache_dir nothing is written, even to the cwd."""
+        monkeypatch.chdir(tmp_path)
+        data, clean, whistles = dolphain.load_processed_file(ears_file)
+        assert len(clean) == data["n_samples"]
+        assert list(tmp_path.iterdir()) == [ears_file]
+
+    def test_cache_version_in_key(self, ears_file, tmp_path, monkeypatch):
+        """Test that bumping CACHE_VERSION misses existing entries."""
+        cache_dir = tmp_path / "cache"
+        dolphain.load_processed_file(ears_file, cache_dir=cache_dir)
+        monkeypatch.setattr(
+            dolphain.batch, "CACHE_VERSION", dolphain.batch.CACHE_VERSION + 1
+        )
+        dolphain.load_processed_file(ears_file, cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+
+class TestDenoiseCached:
+    """Test the denoise-only entry point to the processing cache."""
+
+    def test_cache_roundtrip(self, ears_file, tmp_path):
+        """Test that a cached result matches a fresh denoise."""
+        data = dolphain.read_ears_file(ears_file)["data"]
+        expected = dolphain.wavelet_denoise(data, wavelet="db8", hard_threshold=True)
+        cache_dir = tmp_path / "cache"
+        for _ in range(2):
+            clean = dolphain.denoise_cached(
+                ears_file, data, wavelet="db8", hard_threshold=True, cache_dir=cache_dir
+            )
+            np.testing.assert_array_equal(clean, expected)
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    def test_separate_from_processed_entries(self, ears_file, tmp_path):
+        """Test that denoise-only and full entries never collide."""
+        cache_dir = tmp_path / "cache"
+        data, _, _ = dolphain.load_processed_file(ears_file, cache_dir=cache_dir)
+        clean = dolphain.denoise_cached(ears_file, data["data"], cache_dir=cache_dir)
+        assert isinstance(clean, np.ndarray)
+        assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+
 class TestIntegration:
     """Integration tests for complete workflows."""
 
-    def test_complete_workflow(self):
+    def test_complete_workflow(self, all_files):
         """Test a complete batch processing workflow."""
-        # 1. Find files
-        all_files = dolphain.find_data_files("data", "**/*.210")
+        # 1. Find files (scanned once per session by the all_files fixture)
         assert len(all_files) > 0
 
         # 2. Select subset
@@ -241,3 +331,22 @@ class TestIntegration:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestLoadCheckpoint:
+    """Test replaying quick_find's checkpoint log."""
+
+    def test_skips_partial_lines_and_keeps_last_record(self, tmp_path):
+        """Test blank and truncated lines are skipped and re-runs replace."""
+        path = tmp_path / "checkpoint.jsonl"
+        records = [
+            {"type": "result", "data": {"file": "a", "score": 1}},
+            {"type": "error", "data": {"file": "b", "error": "boom"}},
+            {"type": "result", "data": {"file": "a", "score": 2}},
+        ]
+        lines = [json.dumps(r) for r in records]
+        path.write_text("\n".join(lines) + "\n\n" + lines[0][:10])
+
+        results, errors = dolphain.load_checkpoint(path)
+        assert results == [{"file": "a", "score": 2}]
+        assert errors == [{"file": "b", "error": "boom"}]
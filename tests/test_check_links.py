@@ -0,0 +1,93 @@
+"""Tests for tools/check_links.py, including the optional RE2 backend."""
+
+import importlib
+import io
+import re
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+import check_links
+
+PAGE = """<html><head>
+<link href="css/style.css" rel="stylesheet">
+<link href="https://cdn.example.com/x.css" rel="stylesheet">
+<script src="js/app.js"></script>
+<script src="js/missing.js"></script>
+</head><body>
+<a href="#top">top</a>
+<a href="mailto:a@b.c">mail</a>
+<a href="about.html">about</a>
+<a href='gone.html'>gone</a>
+<img src="img/pic.png">
+</body></html>
+"""
+
+
+@pytest.fixture
+def site(tmp_path):
+    """A small site with one page, some present and some missing links."""
+    for name in ["about.html", "css/style.css", "js/app.js", "js/missing.min.js"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    page = tmp_path / "index.html"
+    page.write_text(PAGE)
+    return page
+
+
+def _fake_re2(bytes_only):
+    """Stand-in re2 module backed by re (optionally rejecting buffers)."""
+
+    class Pattern:
+        def __init__(self, pattern):
+            self._re = re.compile(pattern)
+
+        def findall(self, text):
+            if bytes_only and not isinstance(text, bytes):
+                raise TypeError("expected bytes")
+            return self._re.findall(text)
+
+    return types.SimpleNamespace(compile=Pattern)
+
+
+@pytest.fixture
+def re2_backend(monkeypatch):
+    """Reload check_links with a fake re2; restores the default afterwards."""
+
+    def load(bytes_only=False):
+        monkeypatch.setitem(sys.modules, "re2", _fake_re2(bytes_only))
+        return importlib.reload(check_links)
+
+    yield load
+    monkeypatch.undo()
+    importlib.reload(check_links)
+
+
+def _report(module, page):
+    out = io.StringIO()
+    ok = module.check_local_links(page, out=out)
+    return ok, out.getvalue()
+
+
+def test_default_backend(site):
+    """Test that broken local links are reported with suggestions."""
+    assert check_links.ATTR_RE2 is None
+    ok, report = _report(check_links, site)
+    assert not ok
+    assert "gone.html" in report and "js/missing.js" in report
+    assert "js/missing.min.js" in report
+    assert "mailto" not in report and "cdn.example.com" not in report
+
+
+@pytest.mark.parametrize("bytes_only", [False, True])
+def test_re2_backend_matches_default(site, re2_backend, bytes_only):
+    """Test that the RE2 path finds exactly the links the re path does."""
+    expected = _report(check_links, site)
+    module = re2_backend(bytes_only)
+    assert module.ATTR_RE2 is not None
+    assert _report(module, site) == expected
@@ -7,14 +7,18 @@ Run this to verify your installation:
 """
 
 import sys
+import traceback
+from functools import lru_cache
 from pathlib import Path
 
-# Add parent directory to path for development testing
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Keys every read_ears_file result must carry
+REQUIRED_KEYS = frozenset(
+    {"data", "fs", "time_start", "time_end", "timestamps", "duration", "n_samples"}
+)
 
 
-def test_imports():
-    """Test that all required modules can be imported."""
+def check_imports():
+    """Check that all required modules can be imported."""
     print("Testing imports...")
     try:
         import numpy as np
@@ -36,19 +40,14 @@ def test_read_file():
     try:
         import dolphain
 
-        # Try to find a sample file
-        sample_files = [
+        # Try to find a sample file; stops at the first one that exists
+        sample_files = (
             Path("../unophysics/sample_data/71621DC7.190"),
             Path("../fourier_examples/data/7164403B.130"),
             Path("unophysics/sample_data/71621DC7.190"),
             Path("fourier_examples/data/7164403B.130"),
-        ]
-
-        test_file = None
-        for f in sample_files:
-            if f.exists():
-                test_file = f
-                break
+        )
+        test_file = next((f for f in sample_files if f.exists()), None)
 
         if test_file is None:
             print("⚠ No sample files found to test")
@@ -57,19 +56,10 @@ def test_read_file():
         data = dolphain.read_ears_file(test_file)
 
         # Verify data structure
-        required_keys = [
-            "data",
-            "fs",
-            "time_start",
-            "time_end",
-            "timestamps",
-            "duration",
-            "n_samples",
-        ]
-        for key in required_keys:
-            if key not in data:
-                print(f"✗ Missing key in data: {key}")
-                return False
+        missing = REQUIRED_KEYS - data.keys()
+        if missing:
+            print(f"✗ Missing keys in data: {', '.join(sorted(missing))}")
+            return False
 
         print(f"✓ Successfully read file: {test_file}")
         print(f"  Duration: {data['duration']:.2f} seconds")
@@ -79,14 +69,12 @@ def test_read_file():
 
     except Exception as e:
         print(f"✗ File reading failed: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
 
-def test_functions():
-    """Test that all module functions are available."""
+def check_functions():
+    """Check that all module functions are available."""
     print("\nTesting module functions...")
     try:
         import dolphain
@@ -94,6 +82,7 @@ def test_functions():
         functions = [
             # I/O functions
             "read_ears_file",
+            "read_ears_file_mmap",
             "print_file_info",
             # Signal processing
             "wavelet_denoise",
@@ -107,25 +96,49 @@ def test_functions():
             "plot_wavelet_comparison",
         ]
 
-        for func_name in functions:
-            if not hasattr(dolphain, func_name):
-                print(f"✗ Function missing: {func_name}")
-                return False
-            if not callable(getattr(dolphain, func_name)):
-                print(f"✗ Not callable: {func_name}")
-                return False
+        available = set(dir(dolphain))
+        missing = [name for name in functions if name not in available]
+        if missing:
+            print(f"✗ Functions missing: {', '.join(missing)}")
+            return False
+        non_callable = [
+            name for name in functions if not callable(getattr(dolphain, name))
+        ]
+        if non_callable:
+            print(f"✗ Not callable: {', '.join(non_callable)}")
+            return False
 
         print(f"✓ All {len(functions)} functions available and callable")
         return True
 
     except Exception as e:
         print(f"✗ Function test failed: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
 
+@lru_cache(maxsize=1)
+def imports_ok():
+    """check_imports(), run once per process."""
+    return check_imports()
+
+
+@lru_cache(maxsize=1)
+def functions_ok():
+    """check_functions(), run once per process."""
+    return check_functions()
+
+
+def test_imports():
+    """Test that all required modules can be imported."""
+    assert check_imports()
+
+
+def test_functions():
+    """Test that all module functions are available."""
+    assert check_functions()
+
+
 def main():
     print("=" * 60)
     print("Dolphain Package Test")
@@ -134,8 +147,8 @@ def main():
     results = []
 
     # Run tests
-    results.append(("Import test", test_imports()))
-    results.append(("Function test", test_functions()))
+    results.append(("Import test", imports_ok()))
+    results.append(("Function test", functions_ok()))
     results.append(("File reading test", test_read_file()))
 
     # Summary
@@ -167,4 +180,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Add parent directory to path for development testing; under pytest
+    # conftest.py already does this
+    sys.path.insert(0, str(Path(__file__).parent.parent))
     sys.exit(main())